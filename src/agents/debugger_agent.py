@@ -352,20 +352,21 @@ class DebuggerAgent:
         """
         results = {}
         
-        for diag in diagnostics:
-            try:
-                result = ssh.execute_command(diag, powershell=True)
-                results[diag] = {
-                    'success': result['success'],
-                    'output': result['stdout'],
-                    'error': result['stderr']
-                }
-            except Exception as e:
-                results[diag] = {
-                    'success': False,
-                    'output': '',
-                    'error': str(e)
-                }
+        # Run every diagnostic in one remote invocation
+        try:
+            batch = ssh.execute_batch(diagnostics, powershell=True)
+        except Exception as e:
+            return {
+                diag: {'success': False, 'output': '', 'error': str(e)}
+                for diag in diagnostics
+            }
+        
+        for diag, result in zip(diagnostics, batch):
+            results[diag] = {
+                'success': result['success'],
+                'output': result['stdout'],
+                'error': result['stderr']
+            }
         
         return results
     
@@ -6,8 +6,9 @@ This package contains the core tools for IIS rollback operations:
 
 1. SSH Tool (ssh_tool.py)
    - Remote command execution via SSH
-   - Connection management and retry logic
+   - Connection management, pooling and retry logic
    - PowerShell command execution
+   - Concurrent execution via asyncssh (optional)
 
 2. IIS Tool (iis_tool.py)
    - IIS website management
@@ -26,7 +27,13 @@ This package contains the core tools for IIS rollback operations:
    - Completion/error alerts
 """
 
-from .ssh_tool import SSHExecutor, SSHConfig
+from .ssh_tool import (
+    SSHExecutor,
+    SSHConfig,
+    AsyncSSHExecutor,
+    SSHConnectionPool,
+    UnknownHostKeyError
+)
 from .iis_tool import IISManager, IISSite
 from .backup_tool import (
     BackupManager,
@@ -40,6 +47,9 @@ __all__ = [
     # SSH
     "SSHExecutor",
     "SSHConfig",
+    "AsyncSSHExecutor",
+    "SSHConnectionPool",
+    "UnknownHostKeyError",
     
     # IIS
     "IISManager",
@@ -9,19 +9,168 @@ Author: CrewAI Team
 Version: 1.0.0
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import re
 import time
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
-from .ssh_tool import SSHExecutor
+from .ssh_tool import SSHExecutor, AsyncSSHExecutor, ASYNCSSH_AVAILABLE
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Stay below OpenSSH's default MaxSessions=10 channels per connection
+MAX_CONCURRENT_SESSIONS = 8
 
-@dataclass
+# Fixed command templates, filled in with str.format()
+_SITE_PROJECTION = (
+    "ForEach-Object { [pscustomobject]@{ "
+    "Name=$_.Name; Id=$_.Id; State=$_.State; PhysicalPath=$_.PhysicalPath; "
+    "Bindings=@($_.Bindings.Collection | ForEach-Object { $_.bindingInformation }) "
+    "} } | ConvertTo-Json -Compress -Depth 3"
+)
+_LIST_SITES_CMD = (
+    "Import-Module WebAdministration; Get-Website | " + _SITE_PROJECTION
+)
+# Only this prefix is formatted; _SITE_PROJECTION is appended afterwards
+_GET_SITE_CMD = "Import-Module WebAdministration; Get-Website -Name {} | "
+# Older WebAdministration versions ignore -Name and list every site, so the
+# name is matched again like the toolbox's Get-NamedSite does
+_SITE_EXISTS_CMD = (
+    "[bool](Get-Website -Name {0} -ErrorAction SilentlyContinue | "
+    "Where-Object {{ $_.Name -eq {0} }})"
+)
+_SITE_ACTION_CMD = 'appcmd {} site {}'
+# Small delay between stop and start to ensure a clean restart
+_RESTART_DELAY_CMD = 'Start-Sleep -Seconds 2'
+_GET_STATE_CMD = (
+    "$site = Get-Website -Name {0} | Where-Object {{ $_.Name -eq {0} }}; "
+    "if ($site) {{ $site.State }} else {{ 'NotFound' }}"
+)
+
+# PowerShell script uploaded once per IISManager and invoked with arguments,
+# so repeated operations only send a short command line over SSH
+_TOOLBOX_SCRIPT = r"""
+param(
+    [Parameter(Mandatory = $true)]
+    [ValidateSet('List', 'Get', 'State', 'Exists', 'DeleteContent', 'DeleteFolder')]
+    [string]$Action,
+    [string]$Name,
+    [string]$Path
+)
+
+$ErrorActionPreference = 'Stop'
+$ProgressPreference = 'SilentlyContinue'
+trap { [Console]::Error.WriteLine($_); exit 1 }
+
+Import-Module WebAdministration
+
+function Get-NamedSite {
+    # Older WebAdministration versions ignore -Name and list every site
+    Get-Website -Name $Name | Where-Object { $_.Name -eq $Name }
+}
+
+function ConvertTo-SiteJson {
+    $input | ForEach-Object {
+        [pscustomobject]@{
+            Name = $_.Name
+            Id = $_.Id
+            State = $_.State
+            PhysicalPath = $_.PhysicalPath
+            Bindings = @($_.Bindings.Collection | ForEach-Object { $_.bindingInformation })
+        }
+    } | ConvertTo-Json -Compress -Depth 3
+}
+
+switch ($Action) {
+    'List' { Get-Website | ConvertTo-SiteJson }
+    'Get' { Get-NamedSite | ConvertTo-SiteJson }
+    'State' {
+        $site = Get-NamedSite
+        if ($site) { $site.State } else { 'NotFound' }
+    }
+    'Exists' { [bool](Get-NamedSite) }
+    'DeleteContent' {
+        Remove-Item -Path (Join-Path $Path '*') -Recurse -Force -ErrorAction SilentlyContinue
+        Write-Host 'Content deletion complete'
+    }
+    'DeleteFolder' {
+        Remove-Item -LiteralPath $Path -Recurse -Force
+        Write-Host 'Folder deletion complete'
+    }
+}
+"""
+
+# The toolbox goes into the SSH user's own temp directory: a shared one such
+# as C:\Windows\Temp would let any local user plant a file under the
+# predictable name. The name carries a content hash so an updated script
+# never reuses a stale copy
+_USER_TEMP_CMD = 'Write-Output $env:TEMP'
+_ABSOLUTE_PATH_RE = re.compile(r'^[A-Za-z]:\\')
+_TOOLBOX_NAME = (
+    f"iis_toolbox_{hashlib.sha1(_TOOLBOX_SCRIPT.encode('utf-8')).hexdigest()[:8]}.ps1"
+)
+_TOOLBOX_CMD = (
+    'powershell -NoProfile -NonInteractive -ExecutionPolicy Bypass '
+    '-File "{}" -Action {}'
+)
+# Error powershell.exe prints when the -File script is gone, e.g. after a
+# temp cleanup or profile reset removed the uploaded toolbox
+_TOOLBOX_MISSING_TEXT = 'to the -File parameter does not exist'
+
+# PowerShell treats the typographic single quotes like the ASCII one
+_PS_SINGLE_QUOTE_RE = re.compile("['\u2018\u2019\u201a\u201b]")
+_TRAILING_BACKSLASHES_RE = re.compile(r'\\+$')
+
+
+def _ps_quote(value: str) -> str:
+    """
+    Quote a value as a PowerShell single-quoted string literal.
+    
+    Single-quoted literals are not interpolated, so ``$`` and backticks are
+    taken literally and only quote characters need doubling. IIS site names
+    and Windows paths cannot contain double quotes, so the literal is also
+    safe inside a ``powershell -Command "..."`` wrapper.
+    
+    Args:
+        value: Site name or path to quote
+        
+    Returns:
+        Quoted PowerShell literal
+    """
+    return "'" + _PS_SINGLE_QUOTE_RE.sub(r'\g<0>\g<0>', value) + "'"
+
+
+def _cmd_quote(value: str) -> str:
+    """
+    Quote an argument for a native command run through cmd.exe.
+    
+    Trailing backslashes are doubled so that a path such as ``E:\\Site\\``
+    does not escape the closing quote (a classic robocopy pitfall).
+    
+    Args:
+        value: Site name or path to quote
+        
+    Returns:
+        Double-quoted argument
+    """
+    return '"' + _TRAILING_BACKSLASHES_RE.sub(r'\g<0>\g<0>', value) + '"'
+
+
+
+def _in_event_loop() -> bool:
+    """Check whether an asyncio event loop is running in this thread."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+@dataclass(slots=True)
 class IISSite:
     """
     Represents an IIS website.
@@ -61,20 +210,139 @@ class IISManager:
         >>> iis.start_site("MyWebsite")
     """
     
-    def __init__(self, ssh: SSHExecutor):
+    def __init__(
+        self,
+        ssh: SSHExecutor,
+        cache_ttl: float = 30.0,
+        use_toolbox: bool = True
+    ):
         """
         Initialize IIS Manager with SSH executor.
         
         Args:
             ssh: SSHExecutor instance for remote command execution
+            cache_ttl: Seconds a site listing is reused before refetching
+            use_toolbox: If True, upload the IIS toolbox script on first use
+                and invoke it instead of sending inline PowerShell
         """
         self.ssh = ssh
+        self.cache_ttl = cache_ttl
+        self.use_toolbox = use_toolbox
+        self._toolbox_path: Optional[str] = None
+        self._sites_cache: Optional[List[IISSite]] = None
+        self._sites_index: Dict[str, IISSite] = {}
+        self._sites_cache_time = 0.0
         logger.info("IISManager initialized")
     
-    def list_sites(self) -> List[IISSite]:
+    def _sites_cache_valid(self) -> bool:
+        """Check whether the cached site listing is still fresh."""
+        return (
+            self._sites_cache is not None
+            and time.monotonic() - self._sites_cache_time < self.cache_ttl
+        )
+    
+    def invalidate_cache(self) -> None:
+        """Discard the cached site listing so the next lookup refetches it."""
+        self._sites_cache = None
+        self._sites_index = {}
+        self._sites_cache_time = 0.0
+    
+    def _toolbox_command(self, action: str, **params: str) -> Optional[str]:
+        """
+        Build a command line invoking the uploaded IIS toolbox script.
+        
+        The script is uploaded over SFTP to the SSH user's temp directory
+        the first time it is needed. If that directory cannot be resolved or
+        the upload fails, the toolbox is disabled for this manager and
+        callers fall back to inline commands.
+        
+        Args:
+            action: Toolbox action to run
+            **params: Additional script parameters (e.g. Name, Path)
+            
+        Returns:
+            Command line to run with powershell=False, or None if the
+            toolbox is unavailable
+        """
+        if not self.use_toolbox:
+            return None
+        
+        if self._toolbox_path is None:
+            result = self.ssh.execute_command(_USER_TEMP_CMD, powershell=True)
+            temp_dir = result['stdout'].strip().rstrip('\\')
+            if not result['success'] or not _ABSOLUTE_PATH_RE.match(temp_dir):
+                logger.warning(
+                    "Could not resolve the remote user's temp directory, "
+                    "using inline commands: %s", result['stderr']
+                )
+                self.use_toolbox = False
+                return None
+            
+            path = f'{temp_dir}\\{_TOOLBOX_NAME}'
+            try:
+                self.ssh.upload_text(_TOOLBOX_SCRIPT, path)
+            except Exception as e:
+                logger.warning("IIS toolbox upload failed, using inline commands: %s", e)
+                self.use_toolbox = False
+                return None
+            self._toolbox_path = path
+        
+        args = ''.join(
+            f' -{name} {_cmd_quote(value)}' for name, value in params.items()
+        )
+        return _TOOLBOX_CMD.format(self._toolbox_path, action) + args
+    
+    def _run_toolbox(
+        self,
+        action: str,
+        inline_command: str,
+        **params: str
+    ) -> Dict[str, Any]:
+        """
+        Run a toolbox action, or the equivalent inline PowerShell command.
+        
+        If the uploaded script has disappeared from the remote temp
+        directory, it is uploaded again and the action retried once; if it
+        is missing again, the toolbox is disabled and the inline command
+        is used.
+        
+        Args:
+            action: Toolbox action to run
+            inline_command: PowerShell command used when the toolbox is
+                unavailable
+            **params: Additional script parameters (e.g. Name, Path)
+            
+        Returns:
+            Dict with command execution results
+        """
+        for _ in range(2):
+            command = self._toolbox_command(action, **params)
+            if command is None:
+                break
+            
+            result = self.ssh.execute_command(command, powershell=False)
+            output = result['stderr'] + result['stdout']
+            if result['success'] or _TOOLBOX_MISSING_TEXT not in output:
+                return result
+            
+            logger.warning("IIS toolbox script is missing: %s", self._toolbox_path)
+            self._toolbox_path = None
+        else:
+            # Gone again right after a fresh upload; stop relying on it
+            self.use_toolbox = False
+        
+        return self.ssh.execute_command(inline_command, powershell=True)
+    
+    def list_sites(self, refresh: bool = False) -> List[IISSite]:
         """
         List all IIS websites on the server.
         
+        The listing is cached for ``cache_ttl`` seconds so repeated lookups
+        within one workflow share a single remote call.
+        
+        Args:
+            refresh: If True, bypass the cache and query the server
+            
         Returns:
             List of IISSite objects representing all sites
             
@@ -83,85 +351,148 @@ class IISManager:
             >>> for site in sites:
             ...     print(f"{site.name}: {site.state}")
         """
-        command = (
-            "appcmd list site /xml /config:* | "
-            "powershell -Command \""
-            "$input | "
-            "Select-Xml -XPath '//site' | "
-            "%{ "
-            "$node = $_.Node; "
-            "$bindings = $node.bindings.binding | "
-            "Select-Object @{Name='name'; Expression={$node.name}}, "
-            "@{Name='id'; Expression={$node.id}}, "
-            "@{Name='bindings'; Expression={$bindings}}, "
-            "@{Name='state'; Expression={$node.state}}, "
-            "@{Name='physical_path'; Expression={$node.application.virtualDirectory.path}}"
-            "}\" "
-        )
+        if not refresh and self._sites_cache_valid():
+            return self._sites_cache
         
-        result = self.ssh.execute_command(command, powershell=True)
+        result = self._run_toolbox('List', _LIST_SITES_CMD)
         
         if not result['success']:
-            logger.error(f"Failed to list IIS sites: {result['stderr']}")
+            logger.error("Failed to list IIS sites: %s", result['stderr'])
             return []
         
         sites = self._parse_sites(result['stdout'])
-        logger.info(f"Found {len(sites)} IIS sites")
+        if sites is None:
+            # A garbled listing must not be cached as "no sites"
+            return []
+        
+        self._sites_cache = sites
+        self._sites_index = {site.name.lower(): site for site in sites}
+        self._sites_cache_time = time.monotonic()
+        logger.info("Found %d IIS sites", len(sites))
         return sites
     
-    def _parse_sites(self, output: str) -> List[IISSite]:
+    def _parse_sites(self, output: str) -> Optional[List[IISSite]]:
         """
-        Parse the output of appcmd list sites command.
+        Parse the JSON output of the Get-Website listing command.
         
         Args:
-            output: Raw output from appcmd command
+            output: Raw ConvertTo-Json output (an object or an array)
             
         Returns:
-            List of parsed IISSite objects
+            List of parsed IISSite objects, or None if the output could
+            not be parsed
         """
-        sites = []
-        
-        # Parse each site from the output
-        # Output format: name|id|state|physical_path|binding1,binding2,...
-        for line in output.strip().split('\n'):
-            if not line.strip():
-                continue
-            
-            try:
-                parts = line.split('|')
-                if len(parts) >= 5:
-                    site = IISSite(
-                        name=parts[0].strip(),
-                        id=parts[1].strip(),
-                        state=parts[2].strip(),
-                        physical_path=parts[3].strip(),
-                        bindings=parts[4].split(',') if len(parts) > 4 else []
-                    )
-                    sites.append(site)
-            except Exception as e:
-                logger.warning(f"Failed to parse site line: {line}, error: {e}")
-        
-        return sites
+        try:
+            data = json.loads(output or "[]")
+        except ValueError as e:
+            logger.warning("Failed to parse site listing: %s", e)
+            return None
+        
+        # ConvertTo-Json emits a bare object when there is a single site
+        if isinstance(data, dict):
+            data = [data]
+        
+        try:
+            return [
+                IISSite(
+                    name=d['Name'],
+                    id=str(d['Id']),
+                    state=d['State'],
+                    physical_path=d['PhysicalPath'],
+                    bindings=self._as_list(d.get('Bindings'))
+                )
+                for d in data
+            ]
+        except (KeyError, TypeError) as e:
+            logger.warning("Unexpected site listing format: %s", e)
+            return None
+    
+    @staticmethod
+    def _as_list(value: Any) -> List[str]:
+        """Normalize a JSON scalar-or-array value to a list of strings."""
+        if not value:
+            return []
+        if isinstance(value, list):
+            return value
+        return [value]
     
-    def get_site(self, site_name: str) -> Optional[IISSite]:
+    def get_site(
+        self,
+        site_name: str,
+        refresh: bool = False,
+        full: bool = True
+    ) -> Optional[IISSite]:
         """
         Get information about a specific IIS site.
         
+        A fresh cached listing is always consulted first. On a cache miss
+        the whole listing is fetched (and cached) by default; with
+        ``full=False`` only the requested site is queried, which is cheaper
+        on servers with many sites when no other lookups will follow.
+        
         Args:
             site_name: Name of the site to retrieve
+            refresh: If True, bypass the cached site listing
+            full: If False, query only this site on a cache miss
             
         Returns:
             IISSite object if found, None otherwise
         """
-        sites = self.list_sites()
-        
-        for site in sites:
-            if site.name.lower() == site_name.lower():
-                return site
+        if not full and (refresh or not self._sites_cache_valid()):
+            result = self._run_toolbox(
+                'Get',
+                _GET_SITE_CMD.format(_ps_quote(site_name)) + _SITE_PROJECTION,
+                Name=site_name
+            )
+            
+            if not result['success']:
+                logger.error(
+                    "Failed to get IIS site '%s': %s",
+                    site_name,
+                    result['stderr']
+                )
+                return None
+            
+            # Older WebAdministration versions ignore -Name and list every site
+            for site in self._parse_sites(result['stdout']) or []:
+                if site.name.lower() == site_name.lower():
+                    return site
+        else:
+            sites = self.list_sites(refresh=refresh)
+            
+            # The name index only describes the cached listing, not a failed one
+            if sites is self._sites_cache:
+                site = self._sites_index.get(site_name.lower())
+                if site is not None:
+                    return site
         
-        logger.warning(f"Site '{site_name}' not found")
+        logger.warning("Site '%s' not found", site_name)
         return None
     
+    def site_exists(self, site_name: str) -> bool:
+        """
+        Check whether an IIS site exists.
+        
+        Answers from the cached site listing when it is fresh, otherwise
+        asks the server about this one site only.
+        
+        Args:
+            site_name: Name of the site to look for
+            
+        Returns:
+            bool: True if the site exists, False otherwise
+        """
+        if self._sites_cache_valid():
+            return site_name.lower() in self._sites_index
+        
+        result = self._run_toolbox(
+            'Exists',
+            _SITE_EXISTS_CMD.format(_ps_quote(site_name)),
+            Name=site_name
+        )
+        
+        return result['success'] and result['stdout'].strip() == 'True'
+    
     def stop_site(self, site_name: str) -> Dict[str, Any]:
         """
         Stop an IIS website.
@@ -177,19 +508,18 @@ class IISManager:
             >>> if result['success']:
             ...     print("Site stopped successfully")
         """
-        logger.info(f"Stopping IIS site: {site_name}")
+        logger.info("Stopping IIS site: %s", site_name)
         
         # Use appcmd to stop the site
-        command = f'appcmd stop site "{site_name}"'
+        command = _SITE_ACTION_CMD.format('stop', _cmd_quote(site_name))
         
         result = self.ssh.execute_command(command, powershell=False)
+        self.invalidate_cache()
         
         if result['success']:
-            logger.info(f"Successfully stopped site: {site_name}")
+            logger.info("Successfully stopped site: %s", site_name)
         else:
-            logger.error(
-                f"Failed to stop site '{site_name}': {result['stderr']}"
-            )
+            logger.error("Failed to stop site '%s': %s", site_name, result['stderr'])
         
         return result
     
@@ -208,19 +538,18 @@ class IISManager:
             >>> if result['success']:
             ...     print("Site started successfully")
         """
-        logger.info(f"Starting IIS site: {site_name}")
+        logger.info("Starting IIS site: %s", site_name)
         
         # Use appcmd to start the site
-        command = f'appcmd start site "{site_name}"'
+        command = _SITE_ACTION_CMD.format('start', _cmd_quote(site_name))
         
         result = self.ssh.execute_command(command, powershell=False)
+        self.invalidate_cache()
         
         if result['success']:
-            logger.info(f"Successfully started site: {site_name}")
+            logger.info("Successfully started site: %s", site_name)
         else:
-            logger.error(
-                f"Failed to start site '{site_name}': {result['stderr']}"
-            )
+            logger.error("Failed to start site '%s': %s", site_name, result['stderr'])
         
         return result
     
@@ -234,51 +563,166 @@ class IISManager:
         Returns:
             Dict with command execution results
         """
-        logger.info(f"Restarting IIS site: {site_name}")
-        
-        # Stop the site
-        stop_result = self.stop_site(site_name)
+        logger.info("Restarting IIS site: %s", site_name)
+        
+        # Stop, pause and start in a single remote invocation
+        quoted = _ps_quote(site_name)
+        stop_result, _, start_result = self.ssh.execute_batch(
+            [
+                _SITE_ACTION_CMD.format('stop', quoted),
+                _RESTART_DELAY_CMD,
+                _SITE_ACTION_CMD.format('start', quoted),
+            ],
+            powershell=True,
+            stop_on_error=True
+        )
+        self.invalidate_cache()
         
         if not stop_result['success']:
+            logger.error(
+                "Failed to stop site '%s': %s",
+                site_name,
+                stop_result['stderr']
+            )
             return {
                 'success': False,
                 'message': f"Failed to stop site: {stop_result['stderr']}"
             }
         
-        # Small delay to ensure clean restart
-        time.sleep(2)
-        
-        # Start the site
-        start_result = self.start_site(site_name)
-        
         if start_result['success']:
+            logger.info("Successfully restarted site: %s", site_name)
             return {
                 'success': True,
                 'message': f"Successfully restarted site: {site_name}"
             }
         else:
+            logger.error(
+                "Failed to start site '%s': %s",
+                site_name,
+                start_result['stderr']
+            )
             return {
                 'success': False,
                 'message': f"Failed to start site: {start_result['stderr']}"
             }
     
+    def stop_sites(self, site_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Stop several IIS websites concurrently.
+        
+        Args:
+            site_names: Names of the sites to stop
+            
+        Returns:
+            Dict mapping each site name to its command execution results
+        """
+        return self._run_site_command_many('stop', site_names)
+    
+    def start_sites(self, site_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Start several IIS websites concurrently.
+        
+        Args:
+            site_names: Names of the sites to start
+            
+        Returns:
+            Dict mapping each site name to its command execution results
+        """
+        return self._run_site_command_many('start', site_names)
+    
+    def _run_site_command_many(
+        self,
+        action: str,
+        site_names: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run an appcmd site action for several sites.
+        
+        Commands fan out as parallel channels of one asyncssh connection,
+        capped at MAX_CONCURRENT_SESSIONS. Without asyncssh installed, when
+        called from a running event loop, or when the async connection
+        fails, the sites are processed one after another with the already
+        connected synchronous executor.
+        
+        Args:
+            action: appcmd verb ('stop' or 'start')
+            site_names: Names of the sites to act on
+            
+        Returns:
+            Dict mapping each site name to its command execution results
+        """
+        logger.info("Running '%s' for %d IIS site(s)", action, len(site_names))
+        
+        if not site_names:
+            return {}
+        
+        single = self.stop_site if action == 'stop' else self.start_site
+        if not ASYNCSSH_AVAILABLE or _in_event_loop():
+            return {name: single(name) for name in site_names}
+        
+        async def _run() -> List[Dict[str, Any]]:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_SESSIONS)
+            
+            async with AsyncSSHExecutor(self.ssh.config) as assh:
+                async def _one(name: str) -> Dict[str, Any]:
+                    async with semaphore:
+                        return await assh.execute_command(
+                            _SITE_ACTION_CMD.format(action, _cmd_quote(name)),
+                            powershell=False
+                        )
+                
+                return await asyncio.gather(*(_one(n) for n in site_names))
+        
+        try:
+            results = asyncio.run(_run())
+        except Exception as e:
+            # execute_command reports its own failures, so this is the
+            # connection itself; self.ssh is still usable
+            logger.warning(
+                "Async SSH connection failed, running sequentially: %s", e
+            )
+            return {name: single(name) for name in site_names}
+        self.invalidate_cache()
+        
+        for name, result in zip(site_names, results):
+            if not result['success']:
+                logger.error(
+                    "Failed to %s site '%s': %s",
+                    action,
+                    name,
+                    result['stderr']
+                )
+        
+        return dict(zip(site_names, results))
+    
     def get_site_state(self, site_name: str) -> Optional[str]:
         """
         Get the current state of an IIS site.
         
+        The state is read from the cached site listing when possible; a
+        dedicated Get-Website query is only issued if the site is missing
+        from a fresh listing.
+        
         Args:
             site_name: Name of the site
             
         Returns:
             State string ('Started', 'Stopped') or None if not found
         """
-        command = (
-            f'powershell -Command "'
-            f'$site = Get-Website -Name \\"{site_name}\\"; '
-            f'if ($site) {{ $site.State }} else {{ \\"NotFound\\" }}"'
-        )
+        was_cached = self._sites_cache_valid()
+        site = self.get_site(site_name)
+        
+        if site is None and was_cached:
+            site = self.get_site(site_name, refresh=True)
+        
+        if site is not None:
+            return site.state
         
-        result = self.ssh.execute_command(command, powershell=True)
+        result = self._run_toolbox(
+            'State',
+            _GET_STATE_CMD.format(_ps_quote(site_name)),
+            Name=site_name
+        )
         
         if result['success']:
             return result['stdout'].strip()
@@ -306,34 +750,37 @@ class IISManager:
             ...     print("Content deleted")
         """
         logger.info(
-            f"Deleting site content from: {site_path} "
-            f"(keep_root={keep_root})"
+            "Deleting site content from: %s (keep_root=%s)",
+            site_path,
+            keep_root
         )
         
         if keep_root:
-            # Delete all contents of the folder but keep the folder
+            # Delete all contents of the folder but keep the folder;
+            # -Recurse already removes nested files, no second pass needed
+            action = 'DeleteContent'
+            contents = _ps_quote(site_path.rstrip('\\') + '\\*')
             command = (
-                f'powershell -Command "'
-                f'Remove-Item -Path \\"{site_path}\\*\\" -Recurse -Force -ErrorAction SilentlyContinue; '
-                f'$files = Get-ChildItem -Path \\"{site_path}\\" -File -Recurse; '
-                f'$files | ForEach-Object {{ Remove-Item -Path $_.FullName -Force }}; '
-                f'Write-Host \\"Content deletion complete\\""'
+                f"Remove-Item -Path {contents} -Recurse -Force -ErrorAction SilentlyContinue; "
+                "Write-Host 'Content deletion complete'"
             )
         else:
             # Delete entire folder including root
+            action = 'DeleteFolder'
             command = (
-                f'powershell -Command "'
-                f'Remove-Item -Path \\"{site_path}\\" -Recurse -Force; '
-                f'Write-Host \\"Folder deletion complete\\""'
+                f"Remove-Item -LiteralPath {_ps_quote(site_path)} -Recurse -Force; "
+                "Write-Host 'Folder deletion complete'"
             )
         
-        result = self.ssh.execute_command(command, powershell=True)
+        result = self._run_toolbox(action, command, Path=site_path)
         
         if result['success']:
-            logger.info(f"Successfully deleted content from: {site_path}")
+            logger.info("Successfully deleted content from: %s", site_path)
         else:
             logger.error(
-                f"Failed to delete content from '{site_path}': {result['stderr']}"
+                "Failed to delete content from '%s': %s",
+                site_path,
+                result['stderr']
             )
         
         return result
@@ -341,24 +788,33 @@ class IISManager:
     def copy_files(
         self,
         source_path: str,
-        destination_path: str
+        destination_path: str,
+        restartable: bool = False
     ) -> Dict[str, Any]:
         """
         Copy files using robocopy for reliable file operations.
         
+        Per-file, per-directory and progress output is suppressed so only
+        the job summary is sent back over SSH.
+        
         Args:
             source_path: Source directory path
             destination_path: Destination directory path
+            restartable: If True, copy in restartable mode (/Z). Slower, only
+                worth it over unreliable links.
             
         Returns:
             Dict with command execution results
         """
-        logger.info(f"Copying files from {source_path} to {destination_path}")
+        logger.info("Copying files from %s to %s", source_path, destination_path)
         
         # Use robocopy for reliable file copying
         command = (
-            f'robocopy "{source_path}" "{destination_path}" /E /Z /B /MT:16 /R:3 /W:5'
+            f'robocopy {_cmd_quote(source_path)} {_cmd_quote(destination_path)} '
+            f'/E /B /MT:16 /R:3 /W:5 /NP /NFL /NDL /NC /NS /NJH'
         )
+        if restartable:
+            command += ' /Z'
         
         result = self.ssh.execute_command(command, powershell=False)
         
@@ -370,7 +826,9 @@ class IISManager:
         
         if result['return_code'] in [0, 1, 2]:
             logger.info(
-                f"Successfully copied files from {source_path} to {destination_path}"
+                "Successfully copied files from %s to %s",
+                source_path,
+                destination_path
             )
             return {
                 'success': True,
@@ -380,9 +838,7 @@ class IISManager:
                 'return_code': result['return_code']
             }
         else:
-            logger.error(
-                f"Failed to copy files: {result['stderr']}"
-            )
+            logger.error("Failed to copy files: %s", result['stderr'])
             return {
                 'success': False,
                 'message': f"Copy failed: {result['stderr']}",
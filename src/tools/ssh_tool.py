@@ -10,20 +10,75 @@ Version: 1.0.0
 """
 
 import os
+import re
 import time
+import base64
+import select
+import socket
 import logging
-from typing import Optional, Dict, Any
+import threading
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from dataclasses import dataclass
 
 import paramiko
-from paramiko import SSHClient, AutoAddPolicy
-from tenacity import retry, stop_after_attempt, wait_exponential
+from paramiko import SSHClient, RejectPolicy
+from tenacity import (
+    retry,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+try:
+    import asyncssh
+except ImportError:  # pragma: no cover - optional dependency
+    asyncssh = None
+
+ASYNCSSH_AVAILABLE = asyncssh is not None
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Bytes requested per recv() call when draining command output
+READ_CHUNK_SIZE = 65536
+
+# Seconds to wait for new data before re-checking the channel state
+_POLL_INTERVAL = 0.1
+
+# Line written after each command of a batch: <marker><index>[:<exit code>]
+BATCH_MARKER = '__CMD_END__'
+_BATCH_MARKER_RE = re.compile(rf'^{BATCH_MARKER}(\d+)(?::(-?\d+))?$')
+
+# Windows drive-letter path such as C:/Temp
+_DRIVE_PATH_RE = re.compile(r'^[A-Za-z]:')
+
+# Connection pool key: host, port, username, password, key_path, known_hosts_path
+_PoolKey = Tuple[str, int, str, Optional[str], Optional[str], str]
+
+
+class UnknownHostKeyError(paramiko.SSHException):
+    """Raised when the server's host key is not listed in known_hosts."""
+
+
+class _RejectUnknownHost(RejectPolicy):
+    """RejectPolicy raising a dedicated exception so it is never retried."""
+    
+    def missing_host_key(self, client, hostname, key):
+        raise UnknownHostKeyError(
+            f"Server {hostname!r} not found in known_hosts"
+        )
+
+
+# Connection errors that a retry cannot fix
+_PERMANENT_CONNECT_ERRORS = (
+    UnknownHostKeyError,
+    paramiko.BadHostKeyException,
+    paramiko.AuthenticationException,
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class SSHConfig:
     """
     Configuration for SSH connection to Windows Server.
@@ -35,6 +90,7 @@ class SSHConfig:
         password: SSH password for authentication
         key_path: Optional path to SSH private key file
         timeout: Connection timeout in seconds
+        known_hosts_path: OpenSSH known_hosts file holding trusted host keys
     """
     host: str
     username: str
@@ -42,6 +98,330 @@ class SSHConfig:
     password: Optional[str] = None
     key_path: Optional[str] = None
     timeout: int = 30
+    known_hosts_path: str = '~/.ssh/known_hosts'
+
+
+@lru_cache(maxsize=None)
+def _load_known_hosts(path: str) -> paramiko.HostKeys:
+    """
+    Load trusted host keys from a known_hosts file, once per process.
+    
+    Args:
+        path: Expanded path to the known_hosts file
+        
+    Returns:
+        HostKeys instance (empty if the file cannot be read)
+    """
+    try:
+        return paramiko.HostKeys(path)
+    except IOError as e:
+        logger.warning("Could not load known hosts from %s: %s", path, e)
+        return paramiko.HostKeys()
+
+
+def _wrap_command(command: str, powershell: bool) -> str:
+    """Wrap a command in 'powershell -Command' when requested."""
+    if powershell:
+        return f'powershell -Command "{command}"'
+    return command
+
+
+def _build_batch_script(
+    commands: List[str],
+    powershell: bool,
+    stop_on_error: bool
+) -> str:
+    """
+    Build a single command line that runs several commands in sequence.
+    
+    After each command an end marker carrying its exit code is written to
+    stdout, and a bare end marker to stderr, so the combined output can be
+    split back into per-command results.
+    
+    PowerShell batches are passed with -EncodedCommand, so the commands
+    need no extra quoting. Each command is piped through Out-String so its
+    objects are formatted before its marker is written; otherwise the
+    whole batch shares one formatter and tables from later commands end
+    up after the wrong marker. A command that throws is caught and counted
+    as failed, so it does not end the rest of the batch. cmd batches use delayed expansion so that
+    !ERRORLEVEL! is read after each command instead of when the line is
+    parsed.
+    
+    Args:
+        commands: Commands to run, in order
+        powershell: If True, commands are PowerShell; otherwise cmd
+        stop_on_error: If True, stop after the first failing command
+        
+    Returns:
+        Command line to execute
+    """
+    if powershell:
+        lines = ["$ProgressPreference = 'SilentlyContinue'"]
+        for index, command in enumerate(commands):
+            lines.extend([
+                '$global:LASTEXITCODE = 0',
+                '$global:__ok = $false',
+                # $? after the pipeline would only reflect Out-String
+                f'try {{ & {{\n{command}\n$global:__ok = $?\n}} | Out-String -Width 4096 }} '
+                'catch { $host.UI.WriteErrorLine("$_") }',
+                '$__rc = if ($LASTEXITCODE) { $LASTEXITCODE } '
+                'elseif ($__ok) { 0 } else { 1 }',
+                f'Write-Output "{BATCH_MARKER}{index}:$__rc"',
+                f"$host.UI.WriteErrorLine('{BATCH_MARKER}{index}')",
+            ])
+            if stop_on_error:
+                lines.append('if ($__rc -ne 0) { exit $__rc }')
+        
+        encoded = base64.b64encode('\n'.join(lines).encode('utf-16-le'))
+        return f"powershell -NoProfile -NonInteractive -EncodedCommand {encoded.decode('ascii')}"
+    
+    segments = []
+    for index, command in enumerate(commands):
+        segment = (
+            f'{command} & echo {BATCH_MARKER}{index}:!ERRORLEVEL! '
+            f'& echo {BATCH_MARKER}{index} 1>&2'
+        )
+        if stop_on_error:
+            segment += ' & if !ERRORLEVEL! neq 0 exit /b !ERRORLEVEL!'
+        segments.append(segment)
+    
+    return f'cmd /V:ON /C "{" & ".join(segments)}"'
+
+
+def _split_batch_output(output: str) -> Tuple[List[str], Dict[int, int]]:
+    """
+    Split one output stream of a batch at its end markers.
+    
+    Args:
+        output: Combined stdout or stderr of the batch
+        
+    Returns:
+        Tuple of (per-command output segments, exit codes by command index).
+        Output after the last marker is returned as an extra segment.
+    """
+    segments: List[str] = []
+    exit_codes: Dict[int, int] = {}
+    current: List[str] = []
+    
+    for line in output.splitlines():
+        match = _BATCH_MARKER_RE.match(line.strip())
+        if not match:
+            current.append(line)
+            continue
+        
+        segments.append('\n'.join(current).strip())
+        current = []
+        if match.group(2) is not None:
+            exit_codes[int(match.group(1))] = int(match.group(2))
+    
+    segments.append('\n'.join(current).strip())
+    return segments, exit_codes
+
+
+def _drain_channel(channel: paramiko.Channel, timeout: int) -> Tuple[bytes, bytes]:
+    """
+    Read stdout and stderr from a channel until the command exits and EOF,
+    or until the channel is closed.
+    
+    Both streams are drained in the same loop so a full stderr window can
+    never stall stdout (or vice versa). Chunks are collected in lists and
+    joined once at the end.
+    
+    Args:
+        channel: Channel the command was started on
+        timeout: Seconds without any output before giving up
+        
+    Returns:
+        Tuple of (stdout bytes, stderr bytes)
+        
+    Raises:
+        socket.timeout: If no output arrives for ``timeout`` seconds
+    """
+    deadline = time.monotonic() + timeout
+    out: List[bytes] = []
+    err: List[bytes] = []
+    
+    while True:
+        received = False
+        if channel.recv_ready():
+            out.append(channel.recv(READ_CHUNK_SIZE))
+            received = True
+        if channel.recv_stderr_ready():
+            err.append(channel.recv_stderr(READ_CHUNK_SIZE))
+            received = True
+        
+        if received:
+            deadline = time.monotonic() + timeout
+            continue
+        # The exit status can arrive before the remaining output, so only
+        # stop once the server has also sent EOF. A closed channel (e.g. the
+        # transport dropped) will never deliver either
+        if channel.closed or (channel.exit_status_ready() and channel.eof_received):
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise socket.timeout(f"No output received for {timeout} seconds")
+        
+        if channel.eof_received:
+            # All output is in and the channel stays readable after EOF, so
+            # select() would return at once; wait for the exit status instead
+            channel.status_event.wait(remaining)
+        else:
+            # Wakes early on stdout data; stderr is picked up on the next poll
+            select.select([channel], [], [], min(remaining, _POLL_INTERVAL))
+    
+    return b''.join(out), b''.join(err)
+
+
+class SSHConnectionPool:
+    """
+    Process-wide pool of authenticated SSH clients.
+    
+    Clients are keyed by the server address and the credentials and trust
+    store used to open them, so that several SSHExecutor instances with the
+    same configuration reuse one handshake instead of paying TCP + key
+    exchange + authentication each time, and stay clear of OpenSSH's
+    MaxStartups throttle. An executor with a different password, key or
+    known_hosts file never receives a client another configuration opened.
+    
+    Attributes:
+        max_per_host: Maximum number of open clients per pool key
+        keepalive_interval: Seconds between transport keepalive packets
+    """
+    
+    max_per_host = 4
+    keepalive_interval = 30
+    
+    _pool: Dict[_PoolKey, List[SSHClient]] = {}
+    _open: Dict[_PoolKey, int] = {}
+    _lock = threading.Lock()
+    _available = threading.Condition(_lock)
+    
+    @staticmethod
+    def _key(config: SSHConfig) -> _PoolKey:
+        """Build the pool key for a configuration."""
+        return (
+            config.host,
+            config.port,
+            config.username,
+            config.password,
+            config.key_path,
+            config.known_hosts_path,
+        )
+    
+    @classmethod
+    def _discard(cls, key: _PoolKey) -> None:
+        """Forget one open client for a key; the caller holds the lock."""
+        count = cls._open.get(key, 0) - 1
+        if count > 0:
+            cls._open[key] = count
+        else:
+            cls._open.pop(key, None)
+    
+    @staticmethod
+    def _is_alive(client: SSHClient) -> bool:
+        """Check whether a pooled client still has an active transport."""
+        transport = client.get_transport()
+        return transport is not None and transport.is_active()
+    
+    @classmethod
+    def acquire(
+        cls,
+        config: SSHConfig,
+        factory: Callable[[], SSHClient]
+    ) -> SSHClient:
+        """
+        Check out a client for the given configuration.
+        
+        Reuses an idle client when one is available, otherwise opens a new
+        one with ``factory`` as long as ``max_per_host`` is not exceeded.
+        When the pool is full, waits up to ``config.timeout`` seconds for
+        another caller to release a client.
+        
+        Args:
+            config: SSH connection configuration
+            factory: Callable that opens and authenticates a new client
+            
+        Returns:
+            Connected SSHClient instance
+            
+        Raises:
+            RuntimeError: If no client becomes available before the timeout
+        """
+        key = cls._key(config)
+        deadline = time.monotonic() + config.timeout
+        
+        with cls._available:
+            while True:
+                idle = cls._pool.setdefault(key, [])
+                while idle:
+                    client = idle.pop()
+                    if cls._is_alive(client):
+                        logger.debug("Reusing pooled SSH connection to %s", config.host)
+                        return client
+                    client.close()
+                    cls._discard(key)
+                
+                if cls._open.get(key, 0) < cls.max_per_host:
+                    cls._open[key] = cls._open.get(key, 0) + 1
+                    break
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError(
+                        f"SSH connection pool exhausted for {config.host}"
+                    )
+                cls._available.wait(remaining)
+        
+        # Open the connection outside the lock so other hosts are not blocked
+        try:
+            client = factory()
+        except Exception:
+            with cls._available:
+                cls._discard(key)
+                cls._available.notify()
+            raise
+        
+        transport = client.get_transport()
+        if transport is not None:
+            transport.set_keepalive(cls.keepalive_interval)
+        
+        return client
+    
+    @classmethod
+    def release(cls, client: SSHClient, config: SSHConfig) -> None:
+        """
+        Return a client to the pool for reuse.
+        
+        Args:
+            client: Client previously obtained from acquire()
+            config: Configuration the client was acquired with
+        """
+        key = cls._key(config)
+        
+        with cls._available:
+            if cls._is_alive(client):
+                cls._pool.setdefault(key, []).append(client)
+            else:
+                client.close()
+                cls._discard(key)
+            cls._available.notify()
+    
+    @classmethod
+    def close_all(cls) -> None:
+        """
+        Close every idle pooled client.
+        
+        Clients that are checked out stay counted against ``max_per_host``
+        until they are released.
+        """
+        with cls._available:
+            for key, clients in cls._pool.items():
+                for client in clients:
+                    client.close()
+                    cls._discard(key)
+            cls._pool.clear()
+            cls._available.notify_all()
 
 
 class SSHExecutor:
@@ -54,6 +434,7 @@ class SSHExecutor:
     Attributes:
         config: SSH connection configuration
         client: Paramiko SSH client instance
+        transport: Cached transport of the client, used to open channels
         connected: Connection status flag
         
     Example:
@@ -73,12 +454,13 @@ class SSHExecutor:
         """
         self.config = config
         self.client: Optional[SSHClient] = None
+        self.transport: Optional[paramiko.Transport] = None
         self.connected = False
         
         # Validate configuration
         self._validate_config()
         
-        logger.info(f"SSHExecutor initialized for host: {config.host}:{config.port}")
+        logger.info("SSHExecutor initialized for host: %s:%s", config.host, config.port)
     
     def _validate_config(self) -> None:
         """
@@ -108,6 +490,7 @@ class SSHExecutor:
             bool: True if connection successful, False otherwise
             
         Raises:
+            UnknownHostKeyError: If the host key is not in known_hosts
             paramiko.AuthenticationException: If authentication fails
             paramiko.SSHException: If SSH protocol error occurs
             socket.error: If connection to host fails
@@ -116,37 +499,62 @@ class SSHExecutor:
             logger.warning("Already connected to SSH server")
             return True
         
-        self.client = SSHClient()
-        
-        # Set host key policy - AutoAddPolicy for known hosts
-        # In production, consider using RejectPolicy for security
-        self.client.set_missing_host_key_policy(AutoAddPolicy())
-        
         try:
-            # Connect with retry logic
-            self._connect_with_retry()
+            # Check out a pooled connection, opening one if none is idle
+            self.client = SSHConnectionPool.acquire(
+                self.config,
+                self._open_client
+            )
+            self.transport = self.client.get_transport()
             
             self.connected = True
             logger.info(
-                f"Successfully connected to {self.config.host}:{self.config.port}"
+                "Successfully connected to %s:%s",
+                self.config.host,
+                self.config.port
             )
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect to SSH server: {e}")
+            logger.error("Failed to connect to SSH server: %s", e)
             self.connected = False
             raise
     
+    def _open_client(self) -> SSHClient:
+        """
+        Open and authenticate a new SSH client.
+        
+        Used as the connection pool factory when no idle client exists.
+        
+        Returns:
+            Connected SSHClient instance
+        """
+        self.client = SSHClient()
+        
+        # Only trust host keys already listed in known_hosts; the file is
+        # parsed once per process rather than on every connect
+        known_hosts = os.path.expanduser(self.config.known_hosts_path)
+        self.client.get_host_keys().update(_load_known_hosts(known_hosts))
+        self.client.set_missing_host_key_policy(_RejectUnknownHost())
+        
+        # Connect with retry logic
+        self._connect_with_retry()
+        return self.client
+    
     @retry(
+        retry=retry_if_not_exception_type(_PERMANENT_CONNECT_ERRORS),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        reraise=True
     )
     def _connect_with_retry(self) -> None:
         """
         Internal connection method with retry logic.
         
         This method is decorated with tenacity for automatic retry
-        on connection failures.
+        on connection failures. Unknown or mismatched host keys and
+        authentication failures are raised at once, and the last error
+        is re-raised as-is rather than wrapped in tenacity.RetryError.
         """
         connect_params = {
             'hostname': self.config.host,
@@ -166,14 +574,17 @@ class SSHExecutor:
     
     def disconnect(self) -> None:
         """
-        Close SSH connection gracefully.
+        Release the SSH connection back to the pool.
         
-        Ensures proper cleanup of SSH client resources.
+        The underlying client stays open for reuse by other executors;
+        call SSHConnectionPool.close_all() to close pooled connections.
         """
         if self.client and self.connected:
-            self.client.close()
+            SSHConnectionPool.release(self.client, self.config)
+            self.client = None
+            self.transport = None
             self.connected = False
-            logger.info(f"Disconnected from {self.config.host}")
+            logger.info("Disconnected from %s", self.config.host)
         else:
             logger.warning("No active SSH connection to disconnect")
     
@@ -206,24 +617,26 @@ class SSHExecutor:
             raise RuntimeError("Not connected to SSH server. Call connect() first.")
         
         # Build the full command
-        if powershell:
-            full_command = f'powershell -Command "{command}"'
-        else:
-            full_command = command
+        full_command = _wrap_command(command, powershell)
         
-        logger.debug(f"Executing command: {full_command}")
+        logger.debug("Executing command: %s", full_command)
         
         try:
-            # Execute command
-            stdin, stdout, stderr = self.client.exec_command(
-                full_command,
-                timeout=timeout
-            )
+            # Open the channel straight on the cached transport; no PTY
+            # or environment requests are sent
+            channel = self.transport.open_session(timeout=timeout)
+            try:
+                channel.settimeout(timeout)
+                channel.exec_command(full_command)
+                
+                # Drain both streams incrementally, then decode once
+                stdout_bytes, stderr_bytes = _drain_channel(channel, timeout)
+                exit_code = channel.recv_exit_status()
+            finally:
+                channel.close()
             
-            # Read output
-            stdout_content = stdout.read().decode('utf-8', errors='replace')
-            stderr_content = stderr.read().decode('utf-8', errors='replace')
-            exit_code = stdout.channel.recv_exit_status()
+            stdout_content = stdout_bytes.decode('utf-8', errors='replace')
+            stderr_content = stderr_bytes.decode('utf-8', errors='replace')
             
             result = {
                 'success': exit_code == 0,
@@ -233,13 +646,15 @@ class SSHExecutor:
             }
             
             logger.debug(
-                f"Command exit code: {exit_code}, stdout length: {len(stdout_content)}"
+                "Command exit code: %d, stdout length: %d",
+                exit_code,
+                len(stdout_content)
             )
             
             return result
             
         except Exception as e:
-            logger.error(f"Command execution failed: {e}")
+            logger.error("Command execution failed: %s", e)
             return {
                 'success': False,
                 'stdout': '',
@@ -247,6 +662,106 @@ class SSHExecutor:
                 'return_code': -1
             }
     
+    def execute_batch(
+        self,
+        commands: List[str],
+        timeout: int = 60,
+        powershell: bool = True,
+        stop_on_error: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several commands in one remote invocation.
+        
+        All commands share a single SSH channel and shell startup, which
+        avoids the per-call overhead of calling execute_command repeatedly.
+        
+        Args:
+            commands: Commands to run, in order
+            timeout: Seconds without output before the batch is abandoned
+            powershell: If True, commands are PowerShell; otherwise cmd
+            stop_on_error: If True, skip the remaining commands after the
+                first one that fails
+            
+        Returns:
+            List with one dict per command, with the same keys as
+            execute_command. Commands that never ran report return_code -1.
+            
+        Example:
+            >>> results = ssh.execute_batch(['Get-Date', 'hostname'])
+            >>> [r['stdout'] for r in results]
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected to SSH server. Call connect() first.")
+        
+        if not commands:
+            return []
+        
+        script = _build_batch_script(commands, powershell, stop_on_error)
+        result = self.execute_command(script, timeout=timeout, powershell=False)
+        
+        stdout_parts, exit_codes = _split_batch_output(result['stdout'])
+        stderr_parts, _ = _split_batch_output(result['stderr'])
+        stopped = stop_on_error and any(exit_codes.values())
+        
+        results = []
+        for index in range(len(commands)):
+            if index in exit_codes:
+                return_code = exit_codes[index]
+            elif index == len(exit_codes) and not stopped:
+                # Command was running when the batch ended without its marker
+                return_code = result['return_code'] or -1
+            else:
+                if stopped:
+                    reason = 'an earlier command in the batch failed'
+                else:
+                    reason = 'the batch ended before this command ran'
+                results.append({
+                    'success': False,
+                    'stdout': '',
+                    'stderr': f'Not executed: {reason}',
+                    'return_code': -1
+                })
+                continue
+            
+            results.append({
+                'success': return_code == 0,
+                'stdout': stdout_parts[index] if index < len(stdout_parts) else '',
+                'stderr': stderr_parts[index] if index < len(stderr_parts) else '',
+                'return_code': return_code
+            })
+        
+        return results
+    
+    def upload_text(self, content: str, remote_path: str) -> None:
+        """
+        Write a text file to the remote server over SFTP.
+        
+        Args:
+            content: File content
+            remote_path: Destination path (Windows paths such as
+                C:\\Temp\\x.ps1 are accepted)
+            
+        Raises:
+            RuntimeError: If not connected
+            IOError: If the file cannot be written
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected to SSH server. Call connect() first.")
+        
+        # Windows OpenSSH's SFTP server expects /C:/dir/file
+        sftp_path = remote_path.replace('\\', '/')
+        if _DRIVE_PATH_RE.match(sftp_path):
+            sftp_path = '/' + sftp_path
+        
+        sftp = self.client.open_sftp()
+        try:
+            with sftp.open(sftp_path, 'w') as remote_file:
+                remote_file.write(content)
+        finally:
+            sftp.close()
+        
+        logger.debug("Uploaded %d bytes to %s", len(content), remote_path)
+    
     def execute_script(
         self,
         script_path: str,
@@ -290,4 +805,142 @@ class SSHExecutor:
             f"port={self.config.port}, "
             f"username={self.config.username}, "
             f"connected={self.connected})"
+        )
+
+
+class AsyncSSHExecutor:
+    """
+    Executes commands concurrently on Windows Server over one SSH connection.
+    
+    Built on asyncssh so that several commands can run as parallel channels
+    of a single authenticated connection. Requires the optional ``asyncssh``
+    package; the synchronous SSHExecutor remains the default for
+    single-shot callers.
+    
+    Attributes:
+        config: SSH connection configuration
+        conn: asyncssh connection instance
+        
+    Example:
+        >>> async with AsyncSSHExecutor(config) as ssh:
+        ...     results = await asyncio.gather(
+        ...         ssh.execute_command('appcmd stop site "A"', powershell=False),
+        ...         ssh.execute_command('appcmd stop site "B"', powershell=False),
+        ...     )
+    """
+    
+    def __init__(self, config: SSHConfig):
+        """
+        Initialize async SSH executor with configuration.
+        
+        Args:
+            config: SSHConfig instance with connection parameters
+            
+        Raises:
+            ImportError: If asyncssh is not installed
+        """
+        if not ASYNCSSH_AVAILABLE:
+            raise ImportError(
+                "asyncssh is required for AsyncSSHExecutor (pip install asyncssh)"
+            )
+        
+        self.config = config
+        self.conn = None
+    
+    async def connect(self) -> None:
+        """Establish the SSH connection to Windows Server."""
+        connect_params = {
+            'host': self.config.host,
+            'port': self.config.port,
+            'username': self.config.username,
+            'connect_timeout': self.config.timeout,
+            # Same trust store as SSHExecutor; unknown hosts are rejected
+            'known_hosts': os.path.expanduser(self.config.known_hosts_path),
+        }
+        
+        if self.config.password:
+            connect_params['password'] = self.config.password
+        elif self.config.key_path:
+            connect_params['client_keys'] = [
+                os.path.expanduser(self.config.key_path)
+            ]
+        
+        self.conn = await asyncssh.connect(**connect_params)
+        logger.info(
+            "Async connection established to %s:%s",
+            self.config.host,
+            self.config.port
+        )
+    
+    async def disconnect(self) -> None:
+        """Close the SSH connection gracefully."""
+        if self.conn is not None:
+            self.conn.close()
+            await self.conn.wait_closed()
+            self.conn = None
+            logger.info("Async connection to %s closed", self.config.host)
+    
+    async def execute_command(
+        self,
+        command: str,
+        timeout: int = 60,
+        powershell: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Execute a command on the remote Windows Server.
+        
+        Args:
+            command: Command to execute (without 'powershell' prefix if powershell=True)
+            timeout: Command execution timeout in seconds
+            powershell: If True, wraps command in 'powershell -Command'
+            
+        Returns:
+            Dict with the same keys as SSHExecutor.execute_command
+        """
+        if self.conn is None:
+            raise RuntimeError("Not connected to SSH server. Call connect() first.")
+        
+        full_command = _wrap_command(command, powershell)
+        
+        try:
+            completed = await self.conn.run(
+                full_command,
+                timeout=timeout,
+                check=False
+            )
+            exit_code = completed.exit_status
+            if exit_code is None:
+                exit_code = -1
+            
+            return {
+                'success': exit_code == 0,
+                'stdout': (completed.stdout or '').strip(),
+                'stderr': (completed.stderr or '').strip(),
+                'return_code': exit_code
+            }
+            
+        except Exception as e:
+            logger.error("Async command execution failed: %s", e)
+            return {
+                'success': False,
+                'stdout': '',
+                'stderr': str(e),
+                'return_code': -1
+            }
+    
+    async def __aenter__(self) -> 'AsyncSSHExecutor':
+        """Async context manager entry - connects to SSH server."""
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit - disconnects from SSH server."""
+        await self.disconnect()
+    
+    def __repr__(self) -> str:
+        """String representation of AsyncSSHExecutor instance."""
+        return (
+            f"AsyncSSHExecutor(host={self.config.host}, "
+            f"port={self.config.port}, "
+            f"connected={self.conn is not None})"
         )
\ No newline at end of file
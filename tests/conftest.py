@@ -0,0 +1,105 @@
+"""
+Shared Test Fixtures
+====================
+
+Fixtures shared by the manager test modules.
+
+Author: CrewAI Team
+Version: 1.0.0
+"""
+
+import sys
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+from unittest.mock import DEFAULT, Mock
+
+# Put the project root first on the path exactly once for every test module
+ROOT = str(Path(__file__).resolve().parent.parent)
+sys.path[:] = [ROOT] + [entry for entry in sys.path if entry != ROOT]
+
+# Importing the tool here loads it (and paramiko) once, before collection
+from src.tools.ssh_tool import SSHConfig, SSHExecutor
+
+
+class SSHRouter:
+    """
+    Answers SSH execute_command calls from canned responses.
+    
+    Responses are keyed by a substring of the command; the first key found
+    in the command wins. Commands matching no key fall through to the
+    mock's own return_value, so tests may still set that directly; it
+    defaults to an empty successful result.
+    
+    Attributes:
+        responses: Mapping of command substring to result dict
+    """
+    
+    def __init__(self):
+        self.responses = {}
+    
+    def __call__(self, command, *args, **kwargs):
+        """Dispatch one execute_command call."""
+        for pattern, response in self.responses.items():
+            if pattern in command:
+                return response
+        return DEFAULT
+    
+    def reset(self, ssh):
+        """Clear routes, recorded calls and configured responses of a mock."""
+        self.responses.clear()
+        ssh.reset_mock(return_value=True, side_effect=True)
+        ssh.is_connected.return_value = True
+        ssh.execute_command.return_value = {
+            'success': True,
+            'stdout': '',
+            'stderr': '',
+            'return_code': 0
+        }
+        ssh.execute_command.side_effect = self
+
+
+@pytest.fixture(scope="session")
+def ssh_router():
+    """Create the command router shared by every SSH mock."""
+    return SSHRouter()
+
+
+@pytest.fixture(scope="module")
+def mock_ssh(ssh_router):
+    """Create a mock SSH executor shared by the module."""
+    ssh = Mock(spec=SSHExecutor)
+    # Instance attributes are not part of the class spec
+    ssh.config = SSHConfig(host="192.168.1.100", username="testuser")
+    ssh_router.reset(ssh)
+    return ssh
+
+
+_RESPONSES = {}
+
+
+@pytest.fixture
+def ssh_response(mock_ssh):
+    """
+    Set the result returned by mock_ssh.execute_command.
+    
+    Returns a function taking the result fields; the return code defaults
+    to 0 on success and 1 on failure. Identical results are built once
+    per session and shared read-only.
+    """
+    def _set(success=True, stdout='', stderr='', return_code=None):
+        if return_code is None:
+            return_code = 0 if success else 1
+        key = (success, stdout, stderr, return_code)
+        if key not in _RESPONSES:
+            _RESPONSES[key] = MappingProxyType({
+                'success': success,
+                'stdout': stdout,
+                'stderr': stderr,
+                'return_code': return_code
+            })
+        mock_ssh.execute_command.return_value = _RESPONSES[key]
+        return _RESPONSES[key]
+    
+    return _set
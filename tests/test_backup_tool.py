@@ -9,13 +9,12 @@ Author: CrewAI Team
 Version: 1.0.0
 """
 
-import pytest
-from unittest.mock import Mock, MagicMock, patch
-import os
-import sys
+from dataclasses import asdict
+from datetime import datetime
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+from types import MappingProxyType
+from unittest.mock import Mock
 
 from src.tools.backup_tool import (
     BackupManager,
@@ -23,163 +22,138 @@ from src.tools.backup_tool import (
     RollbackMode,
     BackupInfo
 )
+from src.tools.iis_tool import IISManager
+
+
+# Canned SSH results; copy with {**_OK, ...} to override a field
+_OK = MappingProxyType({'success': True, 'stdout': '', 'stderr': '', 'return_code': 0})
+_FAIL = MappingProxyType({'success': False, 'stdout': '', 'stderr': 'error', 'return_code': 1})
+
+_EXPAND_ARCHIVE = "Expand-Archive"
+
+# Fragments every rollback result message must contain
+_ROLLBACK_OK_MARKERS = ("completed successfully", "MyWebsite")
+_ROLLBACK_FAIL_MARKERS = ("failed", "Failed to copy files")
+
+
+@pytest.fixture(scope="session")
+def frozen_now():
+    """Fixed timestamp standing in for datetime.now()."""
+    return datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="module")
+def mock_iis():
+    """Create a mock IIS manager shared by the module."""
+    return Mock(spec=IISManager)
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_ssh, mock_iis, ssh_router):
+    """Clear calls and configured responses left by the previous test."""
+    ssh_router.reset(mock_ssh)
+    mock_iis.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def backup_manager(mock_ssh, mock_iis):
+    """Create a BackupManager instance (it keeps per-rollback state)."""
+    return BackupManager(mock_ssh, mock_iis)
 
 
 class TestBackupType:
     """Tests for BackupType enum."""
     
-    def test_zip_type(self):
-        """Test ZIP backup type."""
-        assert BackupType.ZIP.value == "zip"
-    
-    def test_folder_type(self):
-        """Test folder backup type."""
-        assert BackupType.FOLDER.value == "folder"
-    
-    def test_unknown_type(self):
-        """Test unknown backup type."""
-        assert BackupType.UNKNOWN.value == "unknown"
+    @pytest.mark.parametrize("member,value", [
+        (BackupType.ZIP, "zip"),
+        (BackupType.FOLDER, "folder"),
+        (BackupType.UNKNOWN, "unknown"),
+    ])
+    def test_backup_type_values(self, member, value):
+        """Test backup type values."""
+        assert member.value == value
 
 
 class TestRollbackMode:
     """Tests for RollbackMode enum."""
     
-    def test_zip_mode(self):
-        """Test ZIP rollback mode."""
-        assert RollbackMode.ZIP.value == "zip"
-    
-    def test_folder_mode(self):
-        """Test folder rollback mode."""
-        assert RollbackMode.FOLDER.value == "folder"
-    
-    def test_none_mode(self):
-        """Test none rollback mode."""
-        assert RollbackMode.NONE.value == "none"
+    @pytest.mark.parametrize("member,value", [
+        (RollbackMode.ZIP, "zip"),
+        (RollbackMode.FOLDER, "folder"),
+        (RollbackMode.NONE, "none"),
+    ])
+    def test_rollback_mode_values(self, member, value):
+        """Test rollback mode values."""
+        assert member.value == value
 
 
 class TestBackupInfo:
     """Tests for BackupInfo dataclass."""
     
-    def test_create_backup_info(self):
-        """Test creating BackupInfo object."""
-        from datetime import datetime
-        
-        info = BackupInfo(
-            path="E:\\Backups\\MyWebsite",
-            type=BackupType.ZIP,
-            name="backup.zip",
-            timestamp=datetime.now()
-        )
-        
-        assert info.path == "E:\\Backups\\MyWebsite"
-        assert info.type == BackupType.ZIP
-        assert info.name == "backup.zip"
-    
-    def test_folder_backup_info(self):
-        """Test folder backup info."""
-        from datetime import datetime
+    @pytest.mark.parametrize("path,backup_type,name", [
+        ("E:\\Backups\\MyWebsite", BackupType.ZIP, "backup.zip"),
+        ("E:\\Backups\\MyWebsite\\Backup20240101", BackupType.FOLDER, "Backup20240101"),
+    ], ids=["zip", "folder"])
+    def test_create_backup_info(self, frozen_now, path, backup_type, name):
+        """Test creating BackupInfo objects."""
+        expected = {
+            'path': path,
+            'type': backup_type,
+            'name': name,
+            'timestamp': frozen_now
+        }
         
-        info = BackupInfo(
-            path="E:\\Backups\\MyWebsite\\Backup20240101",
-            type=BackupType.FOLDER,
-            name="Backup20240101",
-            timestamp=datetime.now()
-        )
+        info = BackupInfo(**expected)
         
-        assert info.type == BackupType.FOLDER
+        assert asdict(info) == expected
 
 
 class TestBackupManager:
     """Tests for BackupManager class."""
     
-    @pytest.fixture
-    def mock_ssh(self):
-        """Create a mock SSH executor."""
-        ssh = MagicMock()
-        ssh.is_connected.return_value = True
-        return ssh
-    
-    @pytest.fixture
-    def mock_iis(self):
-        """Create a mock IIS manager."""
-        iis = MagicMock()
-        return iis
-    
-    @pytest.fixture
-    def backup_manager(self, mock_ssh, mock_iis):
-        """Create a BackupManager instance."""
-        return BackupManager(mock_ssh, mock_iis)
-    
     def test_init(self, backup_manager):
         """Test BackupManager initialization."""
         assert backup_manager.ssh is not None
         assert backup_manager.iis is not None
         assert backup_manager.temp_folder is None
-    
-    def test_detect_backup_type_zip(self, backup_manager, mock_ssh):
-        """Test detecting ZIP backup type."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': '1',
-            'stderr': '',
-            'return_code': 0
-        }
-        
-        result = backup_manager.detect_backup_type("E:\\Backups\\MyWebsite")
-        
-        assert result['type'] == RollbackMode.ZIP
-        assert result['zip_count'] == 1
-    
-    def test_detect_backup_type_folder(self, backup_manager, mock_ssh):
-        """Test detecting folder backup type."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': '0',
-            'stderr': '',
-            'return_code': 0
-        }
-        
-        result = backup_manager.detect_backup_type("E:\\Backups\\MyWebsite")
-        
-        assert result['type'] == RollbackMode.FOLDER
-        assert result['zip_count'] == 0
-    
-    def test_detect_backup_type_abort(self, backup_manager, mock_ssh):
-        """Test detecting multiple ZIP files (abort)."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': '3',
-            'stderr': '',
-            'return_code': 0
-        }
+        assert "BackupManager" in repr(backup_manager)
+    
+    @pytest.mark.parametrize("stdout,success,expected_mode,expected_count", [
+        ('1', True, RollbackMode.ZIP, 1),
+        ('0', True, RollbackMode.FOLDER, 0),
+        ('3', True, RollbackMode.NONE, 3),
+        ('', False, RollbackMode.NONE, -1),
+    ], ids=["zip", "folder", "abort", "command_failure"])
+    def test_detect_backup_type(
+        self, backup_manager, ssh_router, stdout, success, expected_mode, expected_count
+    ):
+        """Test backup type detection from the remote ZIP count."""
+        ssh_router.responses['$zipCount'] = (
+            {**_OK, 'stdout': stdout} if success
+            else {**_FAIL, 'stdout': stdout, 'stderr': 'Command failed'}
+        )
         
         result = backup_manager.detect_backup_type("E:\\Backups\\MyWebsite")
         
-        assert result['type'] == RollbackMode.NONE
-        assert result['zip_count'] == 3
+        assert result['type'] == expected_mode
+        assert result['zip_count'] == expected_count
     
-    def test_detect_backup_type_command_failure(self, backup_manager, mock_ssh):
-        """Test backup detection when command fails."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Command failed',
-            'return_code': 1
+    def test_detect_backup_type_zip_info(self, backup_manager, ssh_router):
+        """Test ZIP mode reads the archive name and timestamp."""
+        ssh_router.responses['$zipCount'] = {**_OK, 'stdout': '1'}
+        ssh_router.responses['$zipFile'] = {
+            **_OK,
+            'stdout': 'MyWebsite_20240115.zip|2024-01-15 10:30:00',
         }
         
         result = backup_manager.detect_backup_type("E:\\Backups\\MyWebsite")
         
-        assert result['type'] == RollbackMode.NONE
-        assert result['zip_count'] == -1
+        assert result['backup_info'].name == "MyWebsite_20240115.zip"
+        assert result['backup_info'].timestamp == datetime(2024, 1, 15, 10, 30, 0)
     
-    def test_create_temp_folder(self, backup_manager, mock_ssh):
+    def test_create_temp_folder(self, backup_manager, ssh_response):
         """Test creating temp folder."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'Created',
-            'stderr': '',
-            'return_code': 0
-        }
+        ssh_response(stdout='Created')
         
         temp_folder = backup_manager.create_temp_folder("E:\\Temp")
         
@@ -187,90 +161,74 @@ class TestBackupManager:
         assert "E:\\Temp" in temp_folder
         assert backup_manager.temp_folder == temp_folder
     
-    def test_extract_zip_success(self, backup_manager, mock_ssh):
-        """Test extracting ZIP archive."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'Extraction complete',
-            'stderr': '',
-            'return_code': 0
-        }
-        
-        result = backup_manager.extract_zip(
-            "E:\\Backups\\backup.zip",
-            "E:\\Temp\\Rollback_20240101"
-        )
+    def test_create_temp_folder_failure(self, backup_manager, ssh_response):
+        """Test failing to create temp folder."""
+        ssh_response(success=False, stderr='Access denied')
         
-        assert result['success'] is True
-        assert "Expand-Archive" in mock_ssh.execute_command.call_args[0][0]
+        with pytest.raises(RuntimeError):
+            backup_manager.create_temp_folder("E:\\Temp")
     
-    def test_extract_zip_failure(self, backup_manager, mock_ssh):
-        """Test failing to extract ZIP."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'ZIP file is corrupt',
-            'return_code': 1
-        }
+    @pytest.mark.parametrize("success,stderr", [
+        (True, ''),
+        (False, 'ZIP file is corrupt'),
+    ], ids=["success", "failure"])
+    def test_extract_zip(self, backup_manager, mock_ssh, ssh_response, success, stderr):
+        """Test extracting a ZIP archive."""
+        ssh_response(
+            success=success,
+            stdout='Extraction complete' if success else '',
+            stderr=stderr
+        )
         
         result = backup_manager.extract_zip(
             "E:\\Backups\\backup.zip",
             "E:\\Temp\\Rollback_20240101"
         )
         
-        assert result['success'] is False
-    
-    def test_create_preventive_backup_success(self, backup_manager, mock_ssh):
-        """Test creating preventive backup."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'Backup created',
-            'stderr': '',
-            'return_code': 0
-        }
-        
-        result = backup_manager.create_preventive_backup(
-            "E:\\Web Sites\\MyWebsite",
-            "E:\\Web Sites Backups\\MyWebsite",
-            "MyWebsite"
+        assert result['success'] is success
+        command = mock_ssh.execute_command.call_args.args[0]
+        assert _EXPAND_ARCHIVE in command
+    
+    @pytest.mark.parametrize("success,stderr", [
+        (True, ''),
+        (False, 'Access denied'),
+    ], ids=["success", "failure"])
+    def test_create_preventive_backup(self, backup_manager, ssh_response, success, stderr):
+        """Test creating a preventive backup."""
+        ssh_response(
+            success=success,
+            stdout='Backup created' if success else '',
+            stderr=stderr
         )
         
-        assert result['success'] is True
-        assert 'backup_path' in result
-        assert 'PreRollback_' in result['backup_path']
-    
-    def test_create_preventive_backup_failure(self, backup_manager, mock_ssh):
-        """Test failing to create preventive backup."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Access denied',
-            'return_code': 1
-        }
-        
         result = backup_manager.create_preventive_backup(
             "E:\\Web Sites\\MyWebsite",
             "E:\\Web Sites Backups\\MyWebsite",
             "MyWebsite"
         )
         
-        assert result['success'] is False
+        assert result['success'] is success
+        assert ('PreRollback_' in (result['backup_path'] or '')) is success
     
-    def test_cleanup_temp_folder_success(self, backup_manager, mock_ssh):
-        """Test cleaning up temp folder."""
+    @pytest.mark.parametrize("success,stderr", [
+        (True, ''),
+        (False, 'Folder in use'),
+    ], ids=["success", "failure"])
+    def test_cleanup_temp_folder(self, backup_manager, ssh_response, success, stderr):
+        """Test cleaning up the temp folder."""
         backup_manager.temp_folder = "E:\\Temp\\Rollback_20240101"
         
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'Cleanup complete',
-            'stderr': '',
-            'return_code': 0
-        }
+        ssh_response(
+            success=success,
+            stdout='Cleanup complete' if success else '',
+            stderr=stderr
+        )
         
         result = backup_manager.cleanup_temp_folder()
         
-        assert result['success'] is True
-        assert backup_manager.temp_folder is None
+        assert result['success'] is success
+        # The temp folder is only forgotten once it has been removed
+        assert (backup_manager.temp_folder is None) is success
     
     def test_cleanup_temp_folder_none(self, backup_manager, mock_ssh):
         """Test cleaning up when no temp folder exists."""
@@ -279,91 +237,18 @@ class TestBackupManager:
         assert result['success'] is True
         assert "No temp folder" in result['message']
     
-    def test_get_rollback_result_success(self, backup_manager):
-        """Test generating successful rollback result."""
-        details = {
-            'mode': 'ZIP',
-            'backup_path': 'E:\\Backups\\backup.zip'
-        }
-        
+    @pytest.mark.parametrize("success,details,markers", [
+        (True, {'mode': 'ZIP', 'backup_path': 'E:\\Backups\\backup.zip'}, _ROLLBACK_OK_MARKERS),
+        (False, {'error': 'Failed to copy files'}, _ROLLBACK_FAIL_MARKERS),
+    ], ids=["success", "failure"])
+    def test_get_rollback_result(self, backup_manager, success, details, markers):
+        """Test generating the rollback result."""
         result = backup_manager.get_rollback_result(
             site_name="MyWebsite",
-            success=True,
+            success=success,
             details=details
         )
         
-        assert result['success'] is True
+        assert result['success'] is success
         assert result['site_name'] == "MyWebsite"
-        assert "successfully" in result['message']
-    
-    def test_get_rollback_result_failure(self, backup_manager):
-        """Test generating failed rollback result."""
-        details = {
-            'error': 'Failed to copy files'
-        }
-        
-        result = backup_manager.get_rollback_result(
-            site_name="MyWebsite",
-            success=False,
-            details=details
-        )
-        
-        assert result['success'] is False
-        assert "failed" in result['message']
-    
-    def test_repr(self, backup_manager):
-        """Test string representation."""
-        repr_str = repr(backup_manager)
-        
-        assert "BackupManager" in repr_str
-
-
-class TestBackupManagerEdgeCases:
-    """Edge case tests for BackupManager."""
-    
-    @pytest.fixture
-    def mock_ssh(self):
-        """Create a mock SSH executor."""
-        ssh = MagicMock()
-        ssh.is_connected.return_value = True
-        return ssh
-    
-    @pytest.fixture
-    def mock_iis(self):
-        """Create a mock IIS manager."""
-        iis = MagicMock()
-        return iis
-    
-    @pytest.fixture
-    def backup_manager(self, mock_ssh, mock_iis):
-        """Create a BackupManager instance."""
-        return BackupManager(mock_ssh, mock_iis)
-    
-    def test_create_temp_folder_failure(self, backup_manager, mock_ssh):
-        """Test failing to create temp folder."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Access denied',
-            'return_code': 1
-        }
-        
-        with pytest.raises(RuntimeError):
-            backup_manager.create_temp_folder("E:\\Temp")
-    
-    def test_cleanup_temp_folder_failure(self, backup_manager, mock_ssh):
-        """Test failing to clean up temp folder."""
-        backup_manager.temp_folder = "E:\\Temp\\Rollback_20240101"
-        
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Folder in use',
-            'return_code': 1
-        }
-        
-        result = backup_manager.cleanup_temp_folder()
-        
-        assert result['success'] is False
-        # Temp folder should still be set (cleanup failed)
-        assert backup_manager.temp_folder is not None
\ No newline at end of file
+        assert all(marker in result['message'] for marker in markers)
@@ -0,0 +1,55 @@
+"""
+Tests for Debugger Agent
+========================
+
+Unit tests for the remote diagnostics of the debugger agent.
+Requires mocking for remote execution.
+
+Author: CrewAI Team
+Version: 1.0.0
+"""
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from src.agents.debugger_agent import DebuggerAgent
+
+
+@pytest.fixture
+def debugger():
+    """Create a DebuggerAgent without building its CrewAI agent."""
+    # run_diagnostics only talks to the SSH executor
+    return DebuggerAgent.__new__(DebuggerAgent)
+
+
+class TestRunDiagnostics:
+    """Tests for DebuggerAgent.run_diagnostics."""
+    
+    def test_results_mapped_per_diagnostic(self, debugger, mock_ssh):
+        """Test each batched result is reported under its diagnostic."""
+        mock_ssh.execute_batch.side_effect = None
+        mock_ssh.execute_batch.return_value = [
+            {'success': True, 'stdout': 'Running', 'stderr': '', 'return_code': 0},
+            {'success': False, 'stdout': '', 'stderr': 'Access denied', 'return_code': 1},
+        ]
+        diagnostics = ["Get-Service sshd", "Get-Website"]
+        
+        results = debugger.run_diagnostics(mock_ssh, diagnostics)
+        
+        mock_ssh.execute_batch.assert_called_once_with(diagnostics, powershell=True)
+        assert results == {
+            "Get-Service sshd": {'success': True, 'output': 'Running', 'error': ''},
+            "Get-Website": {'success': False, 'output': '', 'error': 'Access denied'},
+        }
+    
+    def test_batch_failure_reported_for_every_diagnostic(self, debugger, mock_ssh):
+        """Test a failed batch marks each diagnostic as failed."""
+        mock_ssh.execute_batch.side_effect = RuntimeError("Not connected")
+        
+        results = debugger.run_diagnostics(mock_ssh, ["hostname", "Get-Date"])
+        
+        assert results == {
+            "hostname": {'success': False, 'output': '', 'error': 'Not connected'},
+            "Get-Date": {'success': False, 'output': '', 'error': 'Not connected'},
+        }
@@ -9,17 +9,46 @@ Author: CrewAI Team
 Version: 1.0.0
 """
 
-import pytest
-from unittest.mock import Mock, MagicMock, patch
-import os
-import sys
+import asyncio
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+from types import MappingProxyType
+from unittest.mock import patch
 
 from src.tools.iis_tool import IISManager, IISSite
 
 
+# Canned SSH results; copy with {**_OK, ...} to override a field
+_OK = MappingProxyType({'success': True, 'stdout': '', 'stderr': '', 'return_code': 0})
+_FAIL = MappingProxyType({'success': False, 'stdout': '', 'stderr': 'error', 'return_code': 1})
+
+_ROBOCOPY = "robocopy "
+
+# Temp directory reported by the remote user's session
+_USER_TEMP = MappingProxyType({**_OK, 'stdout': 'C:\\Users\\svc\\AppData\\Local\\Temp\r\n'})
+
+# powershell.exe's answer when the uploaded toolbox script has been removed
+_TOOLBOX_MISSING = MappingProxyType({
+    **_FAIL,
+    'stderr': "The argument 'C:\\Users\\svc\\AppData\\Local\\Temp\\iis_toolbox.ps1' "
+              "to the -File parameter does not exist.",
+    'return_code': -196608,
+})
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_ssh, ssh_router):
+    """Clear calls and configured responses left by the previous test."""
+    ssh_router.reset(mock_ssh)
+    ssh_router.responses['$env:TEMP'] = _USER_TEMP
+
+
+@pytest.fixture
+def iis_manager(mock_ssh):
+    """Create an IISManager instance (it keeps a site cache)."""
+    return IISManager(mock_ssh)
+
+
 class TestIISSite:
     """Tests for IISSite dataclass."""
     
@@ -58,290 +87,486 @@ class TestIISSite:
         
         # Dataclasses don't compare equal by default
         assert site1 == site2
+    
+    def test_site_uses_slots(self):
+        """Test IISSite instances carry no per-instance __dict__."""
+        site = IISSite(
+            name="MyWebsite",
+            id="1",
+            bindings=[],
+            state="Started",
+            physical_path="E:\\Web Sites\\MyWebsite"
+        )
+        
+        assert not hasattr(site, '__dict__')
 
 
 class TestIISManager:
     """Tests for IISManager class."""
     
-    @pytest.fixture
-    def mock_ssh(self):
-        """Create a mock SSH executor."""
-        ssh = MagicMock()
-        ssh.is_connected.return_value = True
-        return ssh
-    
     def test_init(self, mock_ssh):
         """Test IISManager initialization."""
         manager = IISManager(mock_ssh)
         
         assert manager.ssh == mock_ssh
+        assert "IISManager" in repr(manager)
     
-    @pytest.fixture
-    def iis_manager(self, mock_ssh):
-        """Create an IISManager instance."""
-        return IISManager(mock_ssh)
-    
-    def test_list_sites_empty(self, iis_manager, mock_ssh):
+    def test_list_sites_empty(self, iis_manager, ssh_response):
         """Test listing sites when none exist."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': '',
-            'stderr': '',
-            'return_code': 0
-        }
+        ssh_response()
         
         sites = iis_manager.list_sites()
         
         assert sites == []
     
-    def test_list_sites_with_data(self, iis_manager, mock_ssh):
+    def test_list_sites_with_data(self, iis_manager, mock_ssh, ssh_response):
         """Test listing sites with data."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'Site1|1|Started|E:\\Web Sites\\Site1|*:80:example.com\nSite2|2|Stopped|E:\\Web Sites\\Site2|*:80:example2.com',
-            'stderr': '',
-            'return_code': 0
-        }
+        ssh_response(
+            stdout=(
+                '[{"Name":"Site1","Id":1,"State":"Started","PhysicalPath":"E:\\\\Web Sites\\\\Site1","Bindings":"*:80:example.com"},'
+                '{"Name":"Site2","Id":2,"State":"Stopped","PhysicalPath":"E:\\\\Web Sites\\\\Site2","Bindings":["*:80:example2.com","*:443:example2.com"]}]'
+            )
+        )
         
         sites = iis_manager.list_sites()
         
+        command = mock_ssh.execute_command.call_args.args[0]
+        assert command.endswith("-Action List")
+        assert "appcmd" not in command
         assert len(sites) == 2
         assert sites[0].name == "Site1"
+        assert sites[0].id == "1"
+        assert sites[0].bindings == ["*:80:example.com"]
+        assert sites[0].physical_path == "E:\\Web Sites\\Site1"
         assert sites[1].name == "Site2"
+        assert len(sites[1].bindings) == 2
+    
+    def test_list_sites_single_site(self, iis_manager, ssh_response):
+        """Test listing a single site with delimiters in its name."""
+        ssh_response(
+            stdout='{"Name":"My|Site, Inc","Id":3,"State":"Started","PhysicalPath":"E:\\\\Web Sites\\\\MySite","Bindings":null}'
+        )
+        
+        sites = iis_manager.list_sites()
+        
+        assert len(sites) == 1
+        assert sites[0].name == "My|Site, Inc"
+        assert sites[0].bindings == []
     
-    def test_get_site_found(self, iis_manager, mock_ssh):
+    def test_list_sites_command_failure(self, iis_manager, ssh_response):
+        """Test list sites when command fails."""
+        ssh_response(success=False, stderr='Command failed')
+        
+        sites = iis_manager.list_sites()
+        
+        assert sites == []
+    
+    def test_get_site_found(self, iis_manager, ssh_response):
         """Test getting an existing site."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'MyWebsite|1|Started|E:\\Web Sites\\MyWebsite|*',
-            'stderr': '',
-            'return_code': 0
-        }
+        ssh_response(
+            stdout='{"Name":"MyWebsite","Id":1,"State":"Started","PhysicalPath":"E:\\\\Web Sites\\\\MyWebsite","Bindings":"*:80:"}'
+        )
         
         site = iis_manager.get_site("MyWebsite")
         
         assert site is not None
         assert site.name == "MyWebsite"
     
-    def test_get_site_not_found(self, iis_manager, mock_ssh):
+    def test_get_site_not_found(self, iis_manager, ssh_response):
         """Test getting a non-existent site."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': '',
-            'stderr': '',
-            'return_code': 0
-        }
+        ssh_response()
         
         site = iis_manager.get_site("NonexistentSite")
         
         assert site is None
     
-    def test_stop_site_success(self, iis_manager, mock_ssh):
-        """Test stopping a site successfully."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': ' SITE object "MyWebsite" stopped',
-            'stderr': '',
-            'return_code': 0
-        }
+    @pytest.mark.parametrize("action", ["stop", "start"])
+    @pytest.mark.parametrize("success", [True, False], ids=["success", "failure"])
+    def test_site_action(self, iis_manager, mock_ssh, ssh_response, action, success):
+        """Test stopping and starting a site."""
+        ssh_response(
+            success=success,
+            stderr='' if success else 'ERROR ( message:Site "MyWebsite" could not be found. )'
+        )
         
-        result = iis_manager.stop_site("MyWebsite")
+        result = getattr(iis_manager, f"{action}_site")("MyWebsite")
         
-        assert result['success'] is True
+        assert result['success'] is success
         mock_ssh.execute_command.assert_called_with(
-            'appcmd stop site "MyWebsite"',
+            f'appcmd {action} site "MyWebsite"',
             powershell=False
         )
     
-    def test_stop_site_failure(self, iis_manager, mock_ssh):
-        """Test failing to stop a site."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'ERROR ( message:Site "MyWebsite" could not be found. )',
-            'return_code': 1
-        }
+    def test_restart_site(self, iis_manager, mock_ssh):
+        """Test restarting a site."""
+        mock_ssh.execute_batch.return_value = [_OK, _OK, _OK]
         
-        result = iis_manager.stop_site("MyWebsite")
+        result = iis_manager.restart_site("MyWebsite")
         
-        assert result['success'] is False
+        assert result['success'] is True
+        # Stop and start share a single batched call
+        assert mock_ssh.execute_batch.call_count == 1
+        commands = mock_ssh.execute_batch.call_args.args[0]
+        assert commands[0] == "appcmd stop site 'MyWebsite'"
+        assert commands[-1] == "appcmd start site 'MyWebsite'"
+        assert mock_ssh.execute_batch.call_args.kwargs['stop_on_error'] is True
     
-    def test_start_site_success(self, iis_manager, mock_ssh):
-        """Test starting a site successfully."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': ' SITE object "MyWebsite" started',
-            'stderr': '',
-            'return_code': 0
-        }
+    def test_restart_site_quotes_name(self, iis_manager, mock_ssh):
+        """Test site names are passed as PowerShell single-quoted literals."""
+        mock_ssh.execute_batch.return_value = [_OK, _OK, _OK]
         
-        result = iis_manager.start_site("MyWebsite")
+        iis_manager.restart_site("Bob's $Site")
         
-        assert result['success'] is True
+        commands = mock_ssh.execute_batch.call_args.args[0]
+        assert commands[0] == "appcmd stop site 'Bob''s $Site'"
     
-    def test_start_site_failure(self, iis_manager, mock_ssh):
-        """Test failing to start a site."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'ERROR ( message:Site "MyWebsite" could not be found. )',
-            'return_code': 1
-        }
+    def test_restart_site_stop_failure(self, iis_manager, mock_ssh):
+        """Test restarting a site that fails to stop."""
+        skipped = {**_FAIL, 'stderr': 'Not executed', 'return_code': -1}
+        mock_ssh.execute_batch.return_value = [
+            {**_FAIL, 'stderr': 'ERROR'},
+            skipped,
+            skipped
+        ]
         
-        result = iis_manager.start_site("MyWebsite")
+        result = iis_manager.restart_site("MyWebsite")
         
         assert result['success'] is False
+        assert "Failed to stop site" in result['message']
     
-    def test_restart_site(self, iis_manager, mock_ssh):
-        """Test restarting a site."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': ' SITE object "MyWebsite" stopped',
-            'stderr': '',
-            'return_code': 0
-        }
+    def test_stop_sites_sequential_fallback(self, iis_manager, mock_ssh, ssh_response):
+        """Test stopping several sites without asyncssh installed."""
+        ssh_response()
         
-        result = iis_manager.restart_site("MyWebsite")
+        with patch('src.tools.iis_tool.ASYNCSSH_AVAILABLE', False):
+            results = iis_manager.stop_sites(["Site1", "Site2"])
         
-        assert result['success'] is True
-        # Should be called twice (stop and start)
+        assert list(results) == ["Site1", "Site2"]
+        assert all(r['success'] for r in results.values())
+        assert mock_ssh.execute_command.call_count == 2
+    
+    def test_start_sites_concurrent(self, iis_manager):
+        """Test starting several sites over the async executor."""
+        commands = []
+        
+        class FakeAsyncSSH:
+            def __init__(self, config):
+                pass
+            
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc):
+                pass
+            
+            async def execute_command(self, command, powershell=True):
+                commands.append(command)
+                return _OK
+        
+        with patch('src.tools.iis_tool.ASYNCSSH_AVAILABLE', True), \
+                patch('src.tools.iis_tool.AsyncSSHExecutor', FakeAsyncSSH):
+            results = iis_manager.start_sites(["Site1", "Site2", "Site3"])
+        
+        assert set(results) == {"Site1", "Site2", "Site3"}
+        assert sorted(commands) == [
+            'appcmd start site "Site1"',
+            'appcmd start site "Site2"',
+            'appcmd start site "Site3"',
+        ]
+    
+    def test_stop_sites_connection_failure(self, iis_manager, mock_ssh, ssh_response):
+        """Test an async connection failure falls back to the sync executor."""
+        ssh_response()
+        
+        class UnreachableAsyncSSH:
+            def __init__(self, config):
+                pass
+            
+            async def __aenter__(self):
+                raise OSError("Connection refused")
+            
+            async def __aexit__(self, *exc):
+                pass
+        
+        with patch('src.tools.iis_tool.ASYNCSSH_AVAILABLE', True), \
+                patch('src.tools.iis_tool.AsyncSSHExecutor', UnreachableAsyncSSH):
+            results = iis_manager.stop_sites(["Site1", "Site2"])
+        
+        assert list(results) == ["Site1", "Site2"]
+        assert all(r['success'] for r in results.values())
+        assert [c.args[0] for c in mock_ssh.execute_command.call_args_list] == [
+            'appcmd stop site "Site1"',
+            'appcmd stop site "Site2"',
+        ]
+    
+    def test_start_sites_inside_event_loop(self, iis_manager, mock_ssh, ssh_response):
+        """Test sites are started sequentially when a loop is already running."""
+        ssh_response()
+        
+        async def caller():
+            return iis_manager.start_sites(["Site1", "Site2"])
+        
+        with patch('src.tools.iis_tool.ASYNCSSH_AVAILABLE', True), \
+                patch('src.tools.iis_tool.AsyncSSHExecutor') as async_ssh:
+            results = asyncio.run(caller())
+        
+        async_ssh.assert_not_called()
+        assert all(r['success'] for r in results.values())
         assert mock_ssh.execute_command.call_count == 2
     
-    def test_get_site_state(self, iis_manager, mock_ssh):
+    def test_get_site_state(self, iis_manager, ssh_response):
         """Test getting site state."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'Started',
-            'stderr': '',
-            'return_code': 0
-        }
+        ssh_response(stdout='Started')
         
         state = iis_manager.get_site_state("MyWebsite")
         
         assert state == "Started"
     
-    def test_delete_site_content_success(self, iis_manager, mock_ssh):
-        """Test deleting site content successfully."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'Content deletion complete',
-            'stderr': '',
-            'return_code': 0
-        }
+    def test_get_site_state_from_listing(self, iis_manager, mock_ssh, ssh_response):
+        """Test site state is read from the site listing."""
+        ssh_response(
+            stdout='{"Name":"MyWebsite","Id":1,"State":"Stopped","PhysicalPath":"E:\\\\Web Sites\\\\MyWebsite","Bindings":"*:80:"}'
+        )
         
-        result = iis_manager.delete_site_content(
-            "E:\\Web Sites\\MyWebsite",
-            keep_root=True
+        iis_manager.list_sites()
+        state = iis_manager.get_site_state("MyWebsite")
+        
+        assert state == "Stopped"
+        assert mock_ssh.execute_command.call_count == 2  # temp directory lookup + listing
+    
+    def test_get_site_state_not_found(self, iis_manager, ssh_response):
+        """Test getting state when site doesn't exist."""
+        ssh_response(success=False, stderr='Error')
+        
+        state = iis_manager.get_site_state("NonexistentSite")
+        
+        assert state is None
+    
+    def test_get_site_targeted_query(self, iis_manager, mock_ssh, ssh_response):
+        """Test get_site(full=False) queries only the requested site."""
+        ssh_response(
+            stdout='{"Name":"MyWebsite","Id":1,"State":"Started","PhysicalPath":"E:\\\\Web Sites\\\\MyWebsite","Bindings":["*:80:"]}'
         )
         
-        assert result['success'] is True
+        site = iis_manager.get_site("MyWebsite", full=False)
+        
+        assert site.state == "Started"
+        assert mock_ssh.execute_command.call_args.args[0].endswith(
+            '-Action Get -Name "MyWebsite"'
+        )
+        # A single-site query does not populate the listing cache
+        assert iis_manager._sites_cache is None
+    
+    def test_get_site_inline_query(self, mock_ssh, ssh_response):
+        """Test the inline single-site query keeps the projection's braces."""
+        iis_manager = IISManager(mock_ssh, use_toolbox=False)
+        ssh_response(stdout='')
+        
+        assert iis_manager.get_site("My{Site}", full=False) is None
+        
+        command = mock_ssh.execute_command.call_args.args[0]
+        assert command.startswith(
+            "Import-Module WebAdministration; Get-Website -Name 'My{Site}' | "
+            "ForEach-Object { [pscustomobject]@{ "
+        )
+        assert command.endswith("} } | ConvertTo-Json -Compress -Depth 3")
+    
+    def test_site_exists(self, iis_manager, mock_ssh, ssh_response):
+        """Test checking site existence with a targeted query."""
+        ssh_response(stdout='True')
+        
+        assert iis_manager.site_exists("MyWebsite") is True
+        assert "-Action Exists" in mock_ssh.execute_command.call_args.args[0]
+    
+    def test_site_exists_from_cache(self, iis_manager, mock_ssh, ssh_response):
+        """Test site existence is answered from a fresh listing."""
+        ssh_response(
+            stdout='{"Name":"MyWebsite","Id":1,"State":"Started","PhysicalPath":"E:\\\\Web Sites\\\\MyWebsite","Bindings":"*:80:"}'
+        )
+        
+        iis_manager.list_sites()
+        
+        assert iis_manager.site_exists("mywebsite") is True
+        assert iis_manager.site_exists("OtherSite") is False
+        assert mock_ssh.execute_command.call_count == 2  # temp directory lookup + listing
     
-    def test_delete_site_content_without_keep_root(self, iis_manager, mock_ssh):
-        """Test deleting site content without keeping root."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': 'Folder deletion complete',
-            'stderr': '',
-            'return_code': 0
+    def test_list_sites_cached(self, iis_manager, mock_ssh, ssh_router):
+        """Test site listing is reused until invalidated."""
+        ssh_router.responses['-Action List'] = {
+            **_OK,
+            'stdout': '{"Name":"MyWebsite","Id":1,"State":"Started","PhysicalPath":"E:\\\\Web Sites\\\\MyWebsite","Bindings":"*:80:"}',
+        }
+        ssh_router.responses['appcmd stop'] = {
+            **_OK,
+            'stdout': 'SITE object "MyWebsite" changed to stopped state',
         }
         
+        iis_manager.list_sites()
+        iis_manager.get_site("MyWebsite")
+        assert mock_ssh.execute_command.call_count == 2  # temp directory lookup + listing
+        
+        assert iis_manager.stop_site("MyWebsite")['success']
+        sites = iis_manager.list_sites()
+        assert mock_ssh.execute_command.call_count == 4
+        assert sites[0].name == "MyWebsite"
+    
+    def test_truncated_listing_not_cached(self, iis_manager, mock_ssh, ssh_router):
+        """Test an unparseable listing does not hide existing sites."""
+        ssh_router.responses['-Action List'] = {
+            **_OK,
+            'stdout': '[{"Name":"MyWebsite","Id":1,"State":"Sta',
+        }
+        ssh_router.responses['-Action Exists'] = {**_OK, 'stdout': 'True'}
+        
+        assert iis_manager.list_sites() == []
+        assert iis_manager._sites_cache is None
+        assert iis_manager.site_exists("MyWebsite") is True
+        assert "-Action Exists" in mock_ssh.execute_command.call_args.args[0]
+    
+    @pytest.mark.parametrize("keep_root,success,expected_action", [
+        (True, True, "DeleteContent"),
+        (False, True, "DeleteFolder"),
+        (True, False, "DeleteContent"),
+    ], ids=["keep_root", "whole_folder", "failure"])
+    def test_delete_site_content(
+        self, iis_manager, mock_ssh, ssh_response, keep_root, success, expected_action
+    ):
+        """Test deleting site content."""
+        ssh_response(
+            success=success,
+            stdout='Content deletion complete' if success else '',
+            stderr='' if success else 'Path not found'
+        )
+        
         result = iis_manager.delete_site_content(
             "E:\\Web Sites\\MyWebsite",
-            keep_root=False
+            keep_root=keep_root
         )
         
-        assert result['success'] is True
+        assert result['success'] is success
+        command = mock_ssh.execute_command.call_args.args[0]
+        assert f'-Action {expected_action} -Path "E:\\Web Sites\\MyWebsite"' in command
     
-    def test_copy_files_success(self, iis_manager, mock_ssh):
-        """Test copying files with robocopy."""
-        mock_ssh.execute_command.return_value = {
-            'success': True,
-            'stdout': '...',
-            'stderr': '',
-            'return_code': 1
-        }
+    def test_toolbox_uploaded_once(self, iis_manager, mock_ssh, ssh_response):
+        """Test the toolbox script is uploaded on first use only."""
+        ssh_response(stdout='Started')
+        
+        iis_manager.get_site_state("MyWebsite")
+        iis_manager.site_exists("OtherSite")
+        
+        mock_ssh.upload_text.assert_called_once()
+        script, path = mock_ssh.upload_text.call_args.args
+        assert "param(" in script
+        assert path.startswith("C:\\Users\\svc\\AppData\\Local\\Temp\\iis_toolbox_")
+        assert mock_ssh.execute_command.call_args.kwargs['powershell'] is False
+    
+    def test_toolbox_without_user_temp_falls_back(self, iis_manager, mock_ssh, ssh_router):
+        """Test the toolbox is not uploaded when the user temp dir is unknown."""
+        ssh_router.responses['$env:TEMP'] = {**_FAIL, 'stderr': 'Access denied'}
         
-        result = iis_manager.copy_files(
-            "E:\\Backups\\Backup20240101",
-            "E:\\Web Sites\\MyWebsite"
+        iis_manager.get_site_state("MyWebsite")
+        
+        mock_ssh.upload_text.assert_not_called()
+        assert iis_manager.use_toolbox is False
+    
+    def test_inline_lookups_match_site_name(self, mock_ssh, ssh_response):
+        """Test inline fallbacks re-check the name older -Name filters ignore."""
+        iis_manager = IISManager(mock_ssh, use_toolbox=False)
+        ssh_response(stdout='False')
+        name_filter = "Where-Object { $_.Name -eq 'MyWebsite' }"
+        
+        assert iis_manager.site_exists("MyWebsite") is False
+        assert name_filter in mock_ssh.execute_command.call_args.args[0]
+        
+        ssh_response(stdout='NotFound')
+        
+        assert iis_manager.get_site_state("MyWebsite") == 'NotFound'
+        assert name_filter in mock_ssh.execute_command.call_args.args[0]
+    
+    def test_missing_toolbox_is_uploaded_again(self, iis_manager, mock_ssh, ssh_router):
+        """Test a toolbox removed from the remote temp dir is re-uploaded."""
+        ssh_router.responses['-File'] = _TOOLBOX_MISSING
+        
+        def upload(content, path):
+            if mock_ssh.upload_text.call_count == 2:
+                ssh_router.responses['-File'] = {**_OK, 'stdout': 'True'}
+        
+        mock_ssh.upload_text.side_effect = upload
+        
+        assert iis_manager.site_exists("MyWebsite") is True
+        assert mock_ssh.upload_text.call_count == 2
+        assert iis_manager.use_toolbox is True
+    
+    def test_toolbox_missing_twice_falls_back(self, iis_manager, mock_ssh, ssh_router):
+        """Test inline commands are used when the toolbox keeps vanishing."""
+        ssh_router.responses['-File'] = _TOOLBOX_MISSING
+        ssh_router.responses['[bool]'] = {**_OK, 'stdout': 'True'}
+        
+        assert iis_manager.site_exists("MyWebsite") is True
+        assert mock_ssh.upload_text.call_count == 2
+        assert iis_manager.use_toolbox is False
+    
+    def test_toolbox_upload_failure_falls_back(self, iis_manager, mock_ssh, ssh_response):
+        """Test inline commands are used when the toolbox cannot be uploaded."""
+        mock_ssh.upload_text.side_effect = IOError("Permission denied")
+        ssh_response(stdout='Content deletion complete')
+        
+        result = iis_manager.delete_site_content(
+            "E:\\Web Sites\\MyWebsite",
+            keep_root=True
         )
         
         assert result['success'] is True
-        assert "robocopy" in mock_ssh.execute_command.call_args[0][0]
-    
-    def test_copy_files_failure(self, iis_manager, mock_ssh):
-        """Test failing to copy files."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Access is denied',
-            'return_code': 8
-        }
+        command = mock_ssh.execute_command.call_args.args[0]
+        assert command.startswith("Remove-Item -Path 'E:\\Web Sites\\MyWebsite\\*' ")
+        assert not command.startswith("powershell")
+        assert mock_ssh.execute_command.call_args.kwargs['powershell'] is True
+        assert "Get-ChildItem" not in command
+        assert iis_manager.use_toolbox is False
+    
+    @pytest.mark.parametrize("return_code,expected", [
+        (0, True),
+        (1, True),
+        (2, True),
+        (8, False),
+    ])
+    def test_copy_files(self, iis_manager, mock_ssh, ssh_response, return_code, expected):
+        """Test copying files with robocopy and mapping its exit codes."""
+        ssh_response(
+            success=return_code == 0,
+            stdout='...' if expected else '',
+            stderr='' if expected else 'Access is denied',
+            return_code=return_code
+        )
         
         result = iis_manager.copy_files(
             "E:\\Backups\\Backup20240101",
             "E:\\Web Sites\\MyWebsite"
         )
         
-        assert result['success'] is False
-    
-    def test_repr(self, iis_manager):
-        """Test string representation."""
-        repr_str = repr(iis_manager)
-        
-        assert "IISManager" in repr_str
-
-
-class TestIISManagerEdgeCases:
-    """Edge case tests for IISManager."""
-    
-    @pytest.fixture
-    def mock_ssh(self):
-        """Create a mock SSH executor."""
-        ssh = MagicMock()
-        ssh.is_connected.return_value = True
-        return ssh
-    
-    @pytest.fixture
-    def iis_manager(self, mock_ssh):
-        """Create an IISManager instance."""
-        return IISManager(mock_ssh)
-    
-    def test_list_sites_command_failure(self, iis_manager, mock_ssh):
-        """Test list sites when command fails."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Command failed',
-            'return_code': 1
-        }
-        
-        sites = iis_manager.list_sites()
-        
-        assert sites == []
+        assert result['success'] is expected
+        command = mock_ssh.execute_command.call_args.args[0]
+        assert command.startswith(_ROBOCOPY)
+        assert "/NFL" in command
+        assert "/Z" not in command
     
-    def test_get_site_state_not_found(self, iis_manager, mock_ssh):
-        """Test getting state when site doesn't exist."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Error',
-            'return_code': 1
-        }
+    def test_copy_files_trailing_backslash(self, iis_manager, mock_ssh, ssh_response):
+        """Test a trailing backslash does not escape the closing quote."""
+        ssh_response(return_code=1)
         
-        state = iis_manager.get_site_state("NonexistentSite")
+        iis_manager.copy_files("E:\\Backups\\Backup20240101\\", "E:\\Site")
         
-        assert state is None
+        command = mock_ssh.execute_command.call_args.args[0]
+        assert command.startswith('robocopy "E:\\Backups\\Backup20240101\\\\" "E:\\Site" ')
     
-    def test_delete_site_content_failure(self, iis_manager, mock_ssh):
-        """Test failing to delete content."""
-        mock_ssh.execute_command.return_value = {
-            'success': False,
-            'stdout': '',
-            'stderr': 'Path not found',
-            'return_code': 1
-        }
+    def test_copy_files_restartable(self, iis_manager, mock_ssh, ssh_response):
+        """Test copying files in restartable mode."""
+        ssh_response(return_code=1)
         
-        result = iis_manager.delete_site_content("E:\\Web Sites\\MyWebsite")
+        iis_manager.copy_files(
+            "E:\\Backups\\Backup20240101",
+            "E:\\Web Sites\\MyWebsite",
+            restartable=True
+        )
         
-        assert result['success'] is False
\ No newline at end of file
+        assert "/Z" in mock_ssh.execute_command.call_args.args[0]
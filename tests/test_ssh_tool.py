@@ -9,75 +9,187 @@ Author: CrewAI Team
 Version: 1.0.0
 """
 
-import pytest
-from unittest.mock import Mock, MagicMock, patch
+import asyncio
+import base64
+import dataclasses
 import os
-import sys
+import threading
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import paramiko
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from src.tools.ssh_tool import SSHExecutor, SSHConfig
+from src.tools.ssh_tool import (
+    SSHExecutor,
+    SSHConfig,
+    AsyncSSHExecutor,
+    SSHConnectionPool,
+    UnknownHostKeyError,
+    _drain_channel,
+    _load_known_hosts,
+)
 
 
-class TestSSHConfig:
-    """Tests for SSHConfig dataclass."""
+# Raw channel output used by the execute_command tests
+_EMPTY = b""
+_STDOUT_OK = b"process output"
+_STDOUT_QUOTES = b"output with \"quotes\" and 'apostrophes'"
+_STDERR_ERR = b"error occurred"
+
+
+def make_channel(stdout=b"", stderr=b"", exit_code=0):
+    """
+    Create a fake channel that yields the given output chunks.
     
-    def test_default_values(self):
-        """Test SSHConfig default values."""
-        config = SSHConfig(
-            host="192.168.1.100",
-            username="admin"
-        )
-        
-        assert config.host == "192.168.1.100"
-        assert config.port == 22  # default
-        assert config.username == "admin"
-        assert config.password is None  # default
-        assert config.key_path is None  # default
-        assert config.timeout == 30  # default
+    A plain namespace of functions rather than a MagicMock; commands passed
+    to exec_command are recorded in ``commands``.
+    """
+    out = list(stdout) if isinstance(stdout, list) else [stdout] * bool(stdout)
+    err = list(stderr) if isinstance(stderr, list) else [stderr] * bool(stderr)
+    commands = []
     
-    def test_with_password(self):
-        """Test SSHConfig with password."""
-        config = SSHConfig(
-            host="192.168.1.100",
-            username="admin",
-            password="secret"
-        )
-        
-        assert config.password == "secret"
+    return SimpleNamespace(
+        commands=commands,
+        settimeout=lambda timeout: None,
+        exec_command=commands.append,
+        recv_ready=lambda: bool(out),
+        recv=lambda size: out.pop(0),
+        recv_stderr_ready=lambda: bool(err),
+        recv_stderr=lambda size: err.pop(0),
+        exit_status_ready=lambda: True,
+        eof_received=True,
+        closed=False,
+        status_event=threading.Event(),
+        recv_exit_status=lambda: exit_code,
+        close=lambda: None,
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_config():
+    """Create a valid SSH configuration."""
+    return SSHConfig(
+        host="192.168.1.100",
+        username="admin",
+        password="secret"
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_pool():
+    """Create the mock SSH clients shared by the module."""
+    return SimpleNamespace(client=MagicMock(), spare_client=MagicMock())
+
+
+@pytest.fixture(scope="module")
+def patched_client_class(mock_pool):
+    """Patch SSHClient once for the module to hand out the shared client."""
+    with patch('src.tools.ssh_tool.SSHClient') as client_class:
+        client_class.return_value = mock_pool.client
+        yield client_class
+
+
+@pytest.fixture(autouse=True)
+def mock_client_class(patched_client_class, mock_pool):
+    """Clear calls, side effects and transport state of the shared client mocks."""
+    # Configured return values stay: resetting them would also replace the
+    # defaults of magic methods such as __bool__
+    for mock in (patched_client_class, *vars(mock_pool).values()):
+        mock.reset_mock(side_effect=True)
+    # Tests configure the transport (is_active, open_session), so restore
+    # those two explicitly rather than keep the previous test's values
+    for client in vars(mock_pool).values():
+        transport = client.get_transport.return_value
+        transport.is_active.return_value = True
+        transport.open_session.reset_mock(return_value=True)
+    return patched_client_class
+
+
+@pytest.fixture
+def mock_client(mock_pool):
+    """Return the shared mock SSH client."""
+    return mock_pool.client
+
+
+@pytest.fixture
+def spare_client(mock_pool):
+    """Return a second mock SSH client for tests needing two connections."""
+    return mock_pool.spare_client
+
+
+@pytest.fixture
+def fake_asyncssh(monkeypatch):
+    """Install a stand-in asyncssh module recording connects and commands."""
+    class FakeConnection:
+        def __init__(self):
+            self.commands = []
+            self.outcome = None
+            self.closed = False
+        
+        async def run(self, command, timeout=None, check=True):
+            self.commands.append(command)
+            if isinstance(self.outcome, Exception):
+                raise self.outcome
+            return self.outcome
+        
+        def close(self):
+            self.closed = True
+        
+        async def wait_closed(self):
+            pass
     
-    def test_with_key_path(self):
-        """Test SSHConfig with key path."""
-        config = SSHConfig(
-            host="192.168.1.100",
-            username="admin",
-            key_path="~/.ssh/id_rsa"
-        )
-        
-        assert config.key_path == "~/.ssh/id_rsa"
+    fake = SimpleNamespace(conn=FakeConnection(), connect_kwargs=None)
+    
+    async def connect(**kwargs):
+        fake.connect_kwargs = kwargs
+        return fake.conn
+    
+    monkeypatch.setattr('src.tools.ssh_tool.asyncssh', SimpleNamespace(connect=connect))
+    monkeypatch.setattr('src.tools.ssh_tool.ASYNCSSH_AVAILABLE', True)
+    return fake
+
 
+@pytest.fixture(autouse=True)
+def reset_connection_pool():
+    """Start every test with an empty SSH connection pool."""
+    SSHConnectionPool.close_all()
+    yield
+    SSHConnectionPool.close_all()
+    # Executors a test left connected still count against max_per_host
+    SSHConnectionPool._open.clear()
 
+
+class TestSSHConfig:
+    """Tests for SSHConfig dataclass."""
+    
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {'password': "secret"},
+        {'key_path': "~/.ssh/id_rsa"},
+    ], ids=["defaults", "password", "key_path"])
+    def test_config(self, kwargs):
+        """Test SSHConfig fields and defaults."""
+        expected = {
+            'host': "192.168.1.100",
+            'username': "admin",
+            'port': 22,
+            'password': None,
+            'key_path': None,
+            'timeout': 30,
+            'known_hosts_path': "~/.ssh/known_hosts",
+            **kwargs
+        }
+        
+        config = SSHConfig(host="192.168.1.100", username="admin", **kwargs)
+        
+        assert dataclasses.asdict(config) == expected
+
+
+@pytest.mark.slow_setup
 class TestSSHExecutor:
     """Tests for SSHExecutor class."""
     
-    @pytest.fixture
-    def mock_ssh_client(self):
-        """Create a mock SSH client."""
-        with patch('src.tools.ssh_tool.SSHClient') as mock:
-            client = MagicMock()
-            mock.return_value = client
-            yield client
-    
-    @pytest.fixture
-    def valid_config(self):
-        """Create a valid SSH configuration."""
-        return SSHConfig(
-            host="192.168.1.100",
-            username="admin",
-            password="secret"
-        )
-    
     def test_init_without_auth(self, valid_config):
         """Test SSHExecutor initialization without authentication."""
         config = SSHConfig(
@@ -97,17 +209,17 @@ class TestSSHExecutor:
         assert executor.config.host == "192.168.1.100"
         assert executor.connected is False
     
-    def test_init_with_key(self, valid_config):
+    def test_init_with_key(self, tmp_path):
         """Test SSHExecutor initialization with key path."""
+        key_file = tmp_path / "id_rsa"
+        key_file.touch()
         config = SSHConfig(
             host="192.168.1.100",
             username="admin",
-            key_path="~/.ssh/id_rsa"
+            key_path=str(key_file)
         )
         
-        # Mock os.path.exists to return True
-        with patch('os.path.exists', return_value=True):
-            executor = SSHExecutor(config)
+        executor = SSHExecutor(config)
         
         assert executor.connected is False
     
@@ -124,12 +236,8 @@ class TestSSHExecutor:
         
         assert "not found" in str(exc_info.value).lower()
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_connect_success(self, mock_client_class, valid_config):
+    def test_connect_success(self, valid_config, mock_client):
         """Test successful SSH connection."""
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        
         executor = SSHExecutor(valid_config)
         result = executor.connect()
         
@@ -137,12 +245,47 @@ class TestSSHExecutor:
         assert executor.connected is True
         mock_client.connect.assert_called_once()
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_connect_already_connected(self, mock_client_class, valid_config):
-        """Test connecting when already connected."""
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+    def test_connect_rejects_unknown_hosts(self, valid_config, mock_client):
+        """Test unknown host keys are rejected instead of auto-added."""
+        executor = SSHExecutor(valid_config)
+        executor.connect()
+        
+        policy = mock_client.set_missing_host_key_policy.call_args[0][0]
+        assert isinstance(policy, paramiko.RejectPolicy)
+        mock_client.get_host_keys.return_value.update.assert_called_once()
+    
+    def test_unknown_host_fails_without_retry(self, valid_config, mock_client):
+        """Test an unknown host key surfaces at once instead of being retried."""
+        def reject(**kwargs):
+            policy = mock_client.set_missing_host_key_policy.call_args[0][0]
+            policy.missing_host_key(mock_client, kwargs['hostname'], None)
+        
+        mock_client.connect.side_effect = reject
+        executor = SSHExecutor(valid_config)
+        
+        with pytest.raises(UnknownHostKeyError, match="not found in known_hosts"):
+            executor.connect()
         
+        assert mock_client.connect.call_count == 1
+        assert executor.connected is False
+    
+    def test_authentication_failure_not_retried(self, valid_config, mock_client):
+        """Test a rejected password is raised as-is after one attempt."""
+        mock_client.connect.side_effect = paramiko.AuthenticationException("denied")
+        
+        with pytest.raises(paramiko.AuthenticationException):
+            SSHExecutor(valid_config).connect()
+        
+        assert mock_client.connect.call_count == 1
+    
+    def test_missing_known_hosts_file(self, tmp_path):
+        """Test a missing known_hosts file yields an empty trust store."""
+        host_keys = _load_known_hosts(str(tmp_path / "known_hosts"))
+        
+        assert len(host_keys) == 0
+    
+    def test_connect_already_connected(self, valid_config, mock_client):
+        """Test connecting when already connected."""
         executor = SSHExecutor(valid_config)
         executor.connect()  # First connection
         result = executor.connect()  # Second connection attempt
@@ -151,75 +294,132 @@ class TestSSHExecutor:
         # Should only call connect once
         assert mock_client.connect.call_count == 1
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_disconnect(self, mock_client_class, valid_config):
+    def test_disconnect(self, valid_config, mock_client):
         """Test SSH disconnection."""
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        
         executor = SSHExecutor(valid_config)
         executor.connect()
         executor.disconnect()
         
         assert executor.connected is False
+        # Connection is returned to the pool, not closed
+        mock_client.close.assert_not_called()
+        
+        SSHConnectionPool.close_all()
         mock_client.close.assert_called_once()
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_disconnect_not_connected(self, mock_client_class, valid_config):
-        """Test disconnection when not connected."""
-        executor = SSHExecutor(valid_config)
-        executor.disconnect()  # Should not raise
+    def test_connection_reused_across_executors(self, mock_client_class, valid_config, mock_client):
+        """Test pooled connection is reused by a second executor."""
+        with SSHExecutor(valid_config):
+            pass
+        with SSHExecutor(valid_config) as executor:
+            assert executor.client is mock_client
         
-        assert executor.connected is False
+        assert mock_client_class.call_count == 1
+        mock_client.connect.assert_called_once()
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_execute_command_success(self, mock_client_class, valid_config):
-        """Test successful command execution."""
-        mock_client = MagicMock()
-        mock_stdin = MagicMock()
-        mock_stdout = MagicMock()
-        mock_stderr = MagicMock()
+    def test_dead_pooled_connection_replaced(
+        self, mock_client_class, valid_config, mock_client, spare_client
+    ):
+        """Test a pooled connection with an inactive transport is discarded."""
+        mock_client_class.side_effect = [spare_client, mock_client]
+        
+        with SSHExecutor(valid_config):
+            pass
+        spare_client.get_transport.return_value.is_active.return_value = False
         
-        mock_stdout.read.return_value = b"process output"
-        mock_stderr.read.return_value = b""
-        mock_stdout.channel.recv_exit_status.return_value = 0
-        mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
-        mock_client_class.return_value = mock_client
+        with SSHExecutor(valid_config) as executor:
+            assert executor.client is mock_client
         
+        spare_client.close.assert_called_once()
+    
+    def test_pool_keyed_by_credentials(
+        self, mock_client_class, valid_config, mock_client, spare_client
+    ):
+        """Test a different password never reuses another config's client."""
+        mock_client_class.side_effect = [mock_client, spare_client]
+        
+        with SSHExecutor(valid_config):
+            pass
+        other = dataclasses.replace(valid_config, password="other")
+        with SSHExecutor(other) as executor:
+            assert executor.client is spare_client
+    
+    def test_close_all_with_checked_out_client(self, valid_config, mock_client):
+        """Test a client checked out across close_all() is released cleanly."""
         executor = SSHExecutor(valid_config)
         executor.connect()
         
-        result = executor.execute_command("Get-Process", powershell=True)
+        SSHConnectionPool.close_all()
+        mock_client.get_transport.return_value.is_active.return_value = False
+        executor.disconnect()
+        
+        mock_client.close.assert_called_once()
+        assert SSHConnectionPool._open == {}
+    
+    def test_pool_waits_for_release(self, valid_config, mock_client, monkeypatch):
+        """Test a full pool hands over a client released by another caller."""
+        monkeypatch.setattr(SSHConnectionPool, 'max_per_host', 1)
+        client = SSHConnectionPool.acquire(valid_config, lambda: mock_client)
+        timer = threading.Timer(
+            0.05, SSHConnectionPool.release, (client, valid_config)
+        )
+        timer.start()
         
-        assert result['success'] is True
-        assert result['stdout'] == "process output"
-        assert result['stderr'] == ""
-        assert result['return_code'] == 0
+        assert SSHConnectionPool.acquire(valid_config, lambda: None) is mock_client
+        timer.join()
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_execute_command_failure(self, mock_client_class, valid_config):
-        """Test failed command execution."""
-        mock_client = MagicMock()
-        mock_stdin = MagicMock()
-        mock_stdout = MagicMock()
-        mock_stderr = MagicMock()
+    def test_pool_exhausted_times_out(self, valid_config, mock_client, monkeypatch):
+        """Test a full pool gives up once the connect timeout expires."""
+        monkeypatch.setattr(SSHConnectionPool, 'max_per_host', 1)
+        impatient = dataclasses.replace(valid_config, timeout=0)
+        SSHConnectionPool.acquire(impatient, lambda: mock_client)
+        
+        with pytest.raises(RuntimeError, match="exhausted"):
+            SSHConnectionPool.acquire(impatient, lambda: mock_client)
+    
+    def test_pool_factory_failure_frees_slot(self, valid_config, mock_client, monkeypatch):
+        """Test a failed connection attempt does not use up a pool slot."""
+        monkeypatch.setattr(SSHConnectionPool, 'max_per_host', 1)
+        
+        def refuse():
+            raise OSError("Connection refused")
         
-        mock_stdout.read.return_value = b""
-        mock_stderr.read.return_value = b"error occurred"
-        mock_stdout.channel.recv_exit_status.return_value = 1
-        mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
-        mock_client_class.return_value = mock_client
+        with pytest.raises(OSError):
+            SSHConnectionPool.acquire(valid_config, refuse)
+        
+        assert SSHConnectionPool.acquire(valid_config, lambda: mock_client) is mock_client
+    
+    def test_disconnect_not_connected(self, valid_config):
+        """Test disconnection when not connected."""
+        executor = SSHExecutor(valid_config)
+        executor.disconnect()  # Should not raise
+        
+        assert executor.connected is False
+    
+    @pytest.mark.parametrize("stdout,stderr,rc,command,expect_success", [
+        (_STDOUT_OK, _EMPTY, 0, "Get-Process", True),
+        (_EMPTY, _STDERR_ERR, 1, "Get-Process", False),
+        (_STDOUT_QUOTES, _EMPTY, 0, "Test-Path 'C:\\Program Files\\'", True),
+        (_EMPTY, _EMPTY, 0, "echo", True),
+    ], ids=["success", "failure", "special_chars", "empty_output"])
+    def test_execute_command(
+        self, valid_config, mock_client, stdout, stderr, rc, command, expect_success
+    ):
+        """Test command execution results."""
+        channel = make_channel(stdout, stderr, rc)
+        mock_client.get_transport.return_value.open_session.return_value = channel
         
         executor = SSHExecutor(valid_config)
         executor.connect()
         
-        result = executor.execute_command("Get-Process", powershell=True)
+        result = executor.execute_command(command, powershell=True)
         
-        assert result['success'] is False
-        assert result['return_code'] == 1
+        assert result['success'] is expect_success
+        assert result['stdout'] == stdout.decode()
+        assert result['stderr'] == stderr.decode()
+        assert result['return_code'] == rc
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_execute_command_not_connected(self, mock_client_class, valid_config):
+    def test_execute_command_not_connected(self, valid_config):
         """Test command execution without connection."""
         executor = SSHExecutor(valid_config)
         
@@ -228,24 +428,16 @@ class TestSSHExecutor:
         
         assert "Not connected" in str(exc_info.value)
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_context_manager(self, mock_client_class, valid_config):
+    def test_context_manager(self, valid_config):
         """Test SSHExecutor as context manager."""
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        
         with SSHExecutor(valid_config) as executor:
             assert executor.is_connected() is True
         
         assert executor.is_connected() is False
-        mock_client.close.assert_called_once()
+        assert executor.client is None
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_is_connected(self, mock_client_class, valid_config):
+    def test_is_connected(self, valid_config):
         """Test is_connected method."""
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        
         executor = SSHExecutor(valid_config)
         
         assert executor.is_connected() is False
@@ -256,12 +448,8 @@ class TestSSHExecutor:
         executor.disconnect()
         assert executor.is_connected() is False
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_repr(self, mock_client_class, valid_config):
+    def test_repr(self, valid_config):
         """Test string representation."""
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        
         executor = SSHExecutor(valid_config)
         repr_str = repr(executor)
         
@@ -269,57 +457,242 @@ class TestSSHExecutor:
         assert "192.168.1.100" in repr_str
 
 
+@pytest.mark.slow_setup
 class TestSSHExecutorEdgeCases:
     """Edge case tests for SSHExecutor."""
     
-    @pytest.fixture
-    def valid_config(self):
-        """Create a valid SSH configuration."""
-        return SSHConfig(
-            host="192.168.1.100",
-            username="admin",
-            password="secret"
+    def test_chunked_output_is_joined(self, valid_config, mock_client):
+        """Test output received over several chunks is joined before decoding."""
+        # Split a multi-byte UTF-8 character across chunk boundaries
+        channel = make_channel(
+            [b"line 1\n", b"caf\xc3", b"\xa9"],
+            [b"warn", b"ing"],
+            0
+        )
+        mock_client.get_transport.return_value.open_session.return_value = channel
+        
+        executor = SSHExecutor(valid_config)
+        executor.connect()
+        
+        result = executor.execute_command("Get-Content log.txt", powershell=True)
+        
+        assert result['stdout'] == "line 1\ncaf\u00e9"
+        assert result['stderr'] == "warning"
+    
+    def test_output_after_exit_status_is_read(self, valid_config, mock_client, monkeypatch):
+        """Test output arriving after the exit status is still captured."""
+        channel = make_channel(b"[1,", b"", 0)
+        channel.eof_received = False
+        pending = [b"2]"]
+        
+        def late_data(*args):
+            # The tail of the output and EOF arrive after the exit status
+            channel.recv_ready = lambda: bool(pending)
+            channel.recv = lambda size: pending.pop(0)
+            channel.eof_received = True
+            return [], [], []
+        
+        monkeypatch.setattr('src.tools.ssh_tool.select.select', late_data)
+        mock_client.get_transport.return_value.open_session.return_value = channel
+        
+        executor = SSHExecutor(valid_config)
+        executor.connect()
+        
+        result = executor.execute_command("Get-Sites", powershell=True)
+        
+        assert result['stdout'] == "[1,2]"
+    
+    def test_closed_channel_stops_draining(self, monkeypatch):
+        """Test a channel closed by a dropped transport ends the read at once."""
+        channel = paramiko.Channel(0)
+        channel.fileno()  # select() would see the closed pipe as always ready
+        with channel.lock:
+            channel._set_closed()
+        
+        def no_poll(*args):
+            raise AssertionError("closed channel should not be polled")
+        
+        monkeypatch.setattr('src.tools.ssh_tool.select.select', no_poll)
+        
+        assert _drain_channel(channel, 2) == (b"", b"")
+        assert channel.recv_exit_status() == -1
+    
+    def test_exit_status_after_eof_is_awaited(self, monkeypatch):
+        """Test the exit status is awaited without polling once EOF arrived."""
+        channel = paramiko.Channel(0)
+        channel.eof_received = True
+        
+        def no_poll(*args):
+            raise AssertionError("channel at EOF should not be polled")
+        
+        monkeypatch.setattr('src.tools.ssh_tool.select.select', no_poll)
+        timer = threading.Timer(0.05, channel.status_event.set)
+        timer.start()
+        
+        assert _drain_channel(channel, 2) == (b"", b"")
+        timer.join()
+    
+    def test_command_timeout_without_output(self, valid_config, mock_client):
+        """Test command producing no output before the timeout fails."""
+        channel = make_channel()
+        channel.exit_status_ready = lambda: False
+        mock_client.get_transport.return_value.open_session.return_value = channel
+        
+        executor = SSHExecutor(valid_config)
+        executor.connect()
+        
+        result = executor.execute_command("Start-Sleep 60", timeout=0)
+        
+        assert result['success'] is False
+        assert result['return_code'] == -1
+    
+    def test_execute_batch_splits_results(self, valid_config, mock_client):
+        """Test batched commands are split back into per-command results."""
+        channel = make_channel(
+            b"one\r\n__CMD_END__0:0\r\ntwo\r\n__CMD_END__1:3\r\n",
+            b"__CMD_END__0\r\nbad\r\n__CMD_END__1\r\n",
+            0
         )
+        mock_client.get_transport.return_value.open_session.return_value = channel
+        
+        executor = SSHExecutor(valid_config)
+        executor.connect()
+        
+        results = executor.execute_batch(["Get-Date", "hostname"])
+        
+        assert len(channel.commands) == 1
+        assert "-EncodedCommand" in channel.commands[0]
+        script = base64.b64decode(channel.commands[0].split()[-1]).decode('utf-16-le')
+        # Each command is formatted on its own, ahead of its marker
+        assert "& {\nGet-Date\n$global:__ok = $?\n} | Out-String -Width 4096" in script
+        assert script.count("| Out-String -Width 4096") == 2
+        assert results[0] == {
+            'success': True, 'stdout': 'one', 'stderr': '', 'return_code': 0
+        }
+        assert results[1] == {
+            'success': False, 'stdout': 'two', 'stderr': 'bad', 'return_code': 3
+        }
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_command_with_special_chars(self, mock_client_class, valid_config):
-        """Test command execution with special characters."""
-        mock_client = MagicMock()
-        mock_stdin = MagicMock()
-        mock_stdout = MagicMock()
-        mock_stderr = MagicMock()
+    def test_execute_batch_stop_on_error(self, valid_config, mock_client):
+        """Test commands after a failure are reported as not executed."""
+        channel = make_channel(b"__CMD_END__0:1\n", b"", 1)
+        mock_client.get_transport.return_value.open_session.return_value = channel
         
-        mock_stdout.read.return_value = b"output with \"quotes\" and 'apostrophes'"
-        mock_stderr.read.return_value = b""
-        mock_stdout.channel.recv_exit_status.return_value = 0
-        mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
-        mock_client_class.return_value = mock_client
+        executor = SSHExecutor(valid_config)
+        executor.connect()
+        
+        results = executor.execute_batch(
+            ['appcmd stop site "A"', 'appcmd start site "A"'],
+            powershell=False,
+            stop_on_error=True
+        )
+        
+        command = channel.commands[0]
+        assert command.startswith('cmd /V:ON /C "')
+        assert "exit /b" in command
+        assert [r['return_code'] for r in results] == [1, -1]
+        assert "Not executed" in results[1]['stderr']
+    
+    def test_execute_batch_powershell_stop_on_error(self, valid_config, mock_client):
+        """Test a PowerShell batch exits after the first failing command."""
+        channel = make_channel(b"__CMD_END__0:1\r\n", b"stop failed\r\n__CMD_END__0\r\n", 1)
+        mock_client.get_transport.return_value.open_session.return_value = channel
         
         executor = SSHExecutor(valid_config)
         executor.connect()
         
-        result = executor.execute_command("Test-Path 'C:\\Program Files\\'", powershell=True)
+        results = executor.execute_batch(
+            ["appcmd stop site 'A'", 'Start-Sleep -Seconds 2', "appcmd start site 'A'"],
+            stop_on_error=True
+        )
         
-        assert result['success'] is True
+        script = base64.b64decode(channel.commands[0].split()[-1]).decode('utf-16-le')
+        assert script.count("if ($__rc -ne 0) { exit $__rc }") == 3
+        assert results[0] == {
+            'success': False, 'stdout': '', 'stderr': 'stop failed', 'return_code': 1
+        }
+        for result in results[1:]:
+            assert result['stderr'] == 'Not executed: an earlier command in the batch failed'
     
-    @patch('src.tools.ssh_tool.SSHClient')
-    def test_empty_output(self, mock_client_class, valid_config):
-        """Test command with empty output."""
-        mock_client = MagicMock()
-        mock_stdin = MagicMock()
-        mock_stdout = MagicMock()
-        mock_stderr = MagicMock()
+    def test_execute_batch_ended_early(self, valid_config, mock_client):
+        """Test commands a truncated batch never reached are reported as such."""
+        channel = make_channel(b"one\r\n__CMD_END__0:0\r\n", b"", -1)
+        mock_client.get_transport.return_value.open_session.return_value = channel
+        
+        executor = SSHExecutor(valid_config)
+        executor.connect()
         
-        mock_stdout.read.return_value = b""
-        mock_stderr.read.return_value = b""
-        mock_stdout.channel.recv_exit_status.return_value = 0
-        mock_client.exec_command.return_value = (mock_stdin, mock_stdout, mock_stderr)
-        mock_client_class.return_value = mock_client
+        results = executor.execute_batch(["Get-Date", "Get-Service", "hostname"])
+        
+        script = base64.b64decode(channel.commands[0].split()[-1]).decode('utf-16-le')
+        assert "exit $__rc" not in script
+        assert script.count('catch { $host.UI.WriteErrorLine("$_") }') == 3
+        assert [r['return_code'] for r in results] == [0, -1, -1]
+        assert results[2]['stderr'] == 'Not executed: the batch ended before this command ran'
+    
+    def test_upload_text_windows_path(self, valid_config, mock_client):
+        """Test Windows paths are converted to SFTP form on upload."""
+        sftp = mock_client.open_sftp.return_value
         
         executor = SSHExecutor(valid_config)
         executor.connect()
+        executor.upload_text("Write-Host hi", "C:\\Windows\\Temp\\x.ps1")
         
-        result = executor.execute_command("echo", powershell=True)
+        sftp.open.assert_called_once_with("/C:/Windows/Temp/x.ps1", 'w')
+        sftp.close.assert_called_once()
+    
+    def test_async_executor_requires_asyncssh(self, valid_config):
+        """Test AsyncSSHExecutor without asyncssh installed."""
+        with patch('src.tools.ssh_tool.ASYNCSSH_AVAILABLE', False):
+            with pytest.raises(ImportError):
+                AsyncSSHExecutor(valid_config)
+    
+    def test_async_connect_parameters(self, fake_asyncssh):
+        """Test AsyncSSHExecutor connects with the configured credentials."""
+        config = SSHConfig(
+            host="192.168.1.100",
+            username="admin",
+            key_path="~/.ssh/id_rsa",
+            known_hosts_path="~/.ssh/trusted_hosts"
+        )
         
-        assert result['success'] is True
-        assert result['stdout'] == ""
\ No newline at end of file
+        async def run():
+            async with AsyncSSHExecutor(config):
+                pass
+        
+        asyncio.run(run())
+        
+        assert fake_asyncssh.connect_kwargs == {
+            'host': "192.168.1.100",
+            'port': 22,
+            'username': "admin",
+            'connect_timeout': 30,
+            'known_hosts': os.path.expanduser("~/.ssh/trusted_hosts"),
+            'client_keys': [os.path.expanduser("~/.ssh/id_rsa")],
+        }
+        assert fake_asyncssh.conn.closed is True
+    
+    @pytest.mark.parametrize("outcome,expected", [
+        (
+            SimpleNamespace(exit_status=0, stdout="Started\r\n", stderr=None),
+            {'success': True, 'stdout': 'Started', 'stderr': '', 'return_code': 0},
+        ),
+        (
+            SimpleNamespace(exit_status=None, stdout="", stderr="killed"),
+            {'success': False, 'stdout': '', 'stderr': 'killed', 'return_code': -1},
+        ),
+        (
+            asyncio.TimeoutError("Command timed out"),
+            {'success': False, 'stdout': '', 'stderr': 'Command timed out', 'return_code': -1},
+        ),
+    ], ids=["success", "no_exit_status", "timeout"])
+    def test_async_execute_command(self, valid_config, fake_asyncssh, outcome, expected):
+        """Test async command results use the SSHExecutor result format."""
+        fake_asyncssh.conn.outcome = outcome
+        
+        async def run():
+            async with AsyncSSHExecutor(valid_config) as executor:
+                return await executor.execute_command('appcmd stop site "A"', powershell=False)
+        
+        assert asyncio.run(run()) == expected
+        assert fake_asyncssh.conn.commands == ['appcmd stop site "A"']
\ No newline at end of file